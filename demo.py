@@ -15,7 +15,6 @@ for live demonstrations and interviews.
 """
 
 import argparse
-import random
 import sys
 import time
 from pathlib import Path
@@ -31,7 +30,6 @@ from scripts.step4_replay_incident import replay_incident, pipeline
 
 def demo_mode_run(rollouts: int = 50, seed: int = 42) -> None:
     """Run demo with narrated progress output."""
-    random.seed(seed)
     start_time = time.time()
 
     artifacts_dir = Path("artifacts")
@@ -39,7 +37,7 @@ def demo_mode_run(rollouts: int = 50, seed: int = 42) -> None:
 
     # Step 1: Stress Testing
     print(f"[1/4] Running stress tests... ", end="", flush=True)
-    stress_report = run_redteam(mode="adaptive", rollouts=rollouts)
+    stress_report = run_redteam(mode="adaptive", rollouts=rollouts, seed=seed)
     stress_report.save("artifacts/stress_failures.json")
     print(f"Found {stress_report.total_failures} delayed failures (slow-burn vulnerabilities)")
 
@@ -55,7 +53,8 @@ def demo_mode_run(rollouts: int = 50, seed: int = 42) -> None:
         baseline="v1",
         candidate="v2",
         extra_tests="artifacts/regression_tests.json",
-        output="artifacts/gate_report.html"
+        output="artifacts/gate_report.html",
+        seed=seed
     )
     verdict_icon = {"OK": "OK", "WARN": "WARN", "BLOCK": "BLOCK"}.get(verdict, "?")
     if verdict == "BLOCK":
@@ -77,7 +76,6 @@ def demo_mode_run(rollouts: int = 50, seed: int = 42) -> None:
 
 def standard_run(rollouts: int = 50, seed: int = 42) -> None:
     """Run demo with full output."""
-    random.seed(seed)
     start_time = time.time()
 
     print("=" * 60)
@@ -95,7 +93,7 @@ def standard_run(rollouts: int = 50, seed: int = 42) -> None:
     print("=" * 60)
     print("STEP 1: STRESS TESTING")
     print("=" * 60)
-    stress_report = run_redteam(mode="adaptive", rollouts=rollouts)
+    stress_report = run_redteam(mode="adaptive", rollouts=rollouts, seed=seed)
     stress_report.save("artifacts/stress_failures.json")
     print(f"\nDiscovered {stress_report.total_failures} failures")
     print(f"Saved to artifacts/stress_failures.json")
@@ -119,7 +117,8 @@ def standard_run(rollouts: int = 50, seed: int = 42) -> None:
         baseline="v1",
         candidate="v2",
         extra_tests="artifacts/regression_tests.json",
-        output="artifacts/gate_report.html"
+        output="artifacts/gate_report.html",
+        seed=seed
     )
     print(f"\nRelease verdict: {verdict}")
     print(f"Report saved to: {report_path}")
@@ -0,0 +1,637 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the Stress Test and Release Gate Pipeline
+
+Measures the performance claims made by the step scripts so they can be
+re-checked on any machine.
+
+Usage:
+    python scripts/benchmarks.py memory --n 1000000
+    python scripts/benchmarks.py progress --rollouts 200000
+    python scripts/benchmarks.py dedup --n 100000
+    python scripts/benchmarks.py aggregate --n 1000000
+    python scripts/benchmarks.py executor --tests 2000 --latency 0.005
+    python scripts/benchmarks.py priority --tests 20000 --latency 0.001 --broken 0.1
+    python scripts/benchmarks.py paired --trials 400
+    python scripts/benchmarks.py bootstrap --n 100000 --resamples 10000
+    python scripts/benchmarks.py matrix --n 1000000
+"""
+
+import argparse
+import contextlib
+import copy
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import partial
+from pathlib import Path
+from typing import Callable, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from step1_run_stress_tests import (
+    ATTACK_TYPES, FailureAggregates, ProgressMonitor, make_failure, run_shard
+)
+from step2_generate_regression import NearDuplicateDedup, TestGenerator
+import bootstrap
+from rng_streams import RNGStreams
+import results_matrix as matrix_module
+from step3_run_release_gate import (
+    FailFast, ResultAggregator, TestExecutor, TestResult, compute_p_value,
+    mcnemar_p_value, paired_counts, results_matrix, run_pairs, run_regression, run_test
+)
+from result_cache import ResultCache
+from test_history import TestHistory
+
+
+@dataclass
+class LegacyFailure:
+    """Failure layout before TurnRefs: per-instance __dict__, built lists."""
+    failure_id: str
+    rollout_id: int
+    failure_turn: int
+    attack_type: str
+    harm_level: int
+    trajectory: List[str]
+    model_responses: List[str]
+
+
+@dataclass
+class LegacyTestResult:
+    """TestResult layout before __slots__."""
+    test_id: str
+    model: str
+    passed: bool
+    failure_turn: Optional[int]
+    confidence: float
+
+
+def measure(build: Callable[[], list]) -> int:
+    """Return the bytes retained by a freshly built list of records."""
+    tracemalloc.start()
+    records = build()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del records
+    return retained
+
+
+def bench_memory(n: int, seed: int):
+    """Compare legacy and compact Failure / TestResult memory at ``n`` records."""
+    rng = random.Random(seed)
+    turns = [rng.randint(1, 8) for _ in range(n)]
+    attacks = [rng.choice(ATTACK_TYPES) for _ in range(n)]
+    test_ids = [f"reg_{i:08x}" for i in range(n)]
+
+    def legacy_failures():
+        return [
+            LegacyFailure(
+                failure_id=f"fail_{i:04d}",
+                rollout_id=i,
+                failure_turn=turns[i],
+                attack_type=attacks[i],
+                harm_level=3,
+                trajectory=[f"Turn {t}: [redacted attack]" for t in range(1, turns[i] + 1)],
+                model_responses=[f"Turn {t}: [redacted response]" for t in range(1, turns[i] + 1)]
+            )
+            for i in range(n)
+        ]
+
+    def compact_failures():
+        failures = []
+        for i in range(n):
+            failure = make_failure(i, turns[i], attacks[i], 3)
+            failure.failure_id = f"fail_{i:04d}"
+            failures.append(failure)
+        return failures
+
+    def legacy_results():
+        return [LegacyTestResult(test_ids[i], "v2", False, 4, 0.8 + i * 1e-9) for i in range(n)]
+
+    def compact_results():
+        return [TestResult(test_ids[i], "v2", False, 4, 0.8 + i * 1e-9) for i in range(n)]
+
+    rows = [
+        ("Failure", "legacy", measure(legacy_failures)),
+        ("Failure", "compact", measure(compact_failures)),
+        ("TestResult", "legacy", measure(legacy_results)),
+        ("TestResult", "compact", measure(compact_results)),
+    ]
+
+    print(f"Records per type: {n:,}\n")
+    print(f"{'Record':<12}{'Layout':<10}{'Total MB':>10}{'Bytes/rec':>11}")
+    for record, layout, retained in rows:
+        print(f"{record:<12}{layout:<10}{retained / 1e6:>10.1f}{retained / n:>11.0f}")
+
+    print()
+    for k in (0, 2):
+        saved = 1 - rows[k + 1][2] / rows[k][2]
+        print(f"{rows[k][0]}: compact layout uses {saved:.0%} less memory")
+
+
+def bench_progress(rollouts: int, seed: int):
+    """Cost of ProgressMonitor.update relative to the rollout loop."""
+    start = time.perf_counter()
+    run_shard("adaptive", 0, rollouts, seed)
+    per_rollout = (time.perf_counter() - start) / rollouts
+
+    calls = 1_000_000
+    monitor = ProgressMonitor(rollouts, interval=3600)
+    aggregates = FailureAggregates()
+    monitor.start(0, aggregates)
+    start = time.perf_counter()
+    for i in range(calls):
+        monitor.update(i, aggregates)
+    per_update = (time.perf_counter() - start) / calls
+
+    # run_redteam calls update once per shard of up to 10,000 rollouts;
+    # 1,000 is the smallest shard (early-stopping chunks)
+    print(f"Rollout:          {per_rollout * 1e6:8.2f} us")
+    print(f"Progress update:  {per_update * 1e9:8.0f} ns (no emit)")
+    for shard in (1_000, 10_000):
+        overhead = per_update / (shard * per_rollout)
+        print(f"Overhead at {shard:>6,} rollouts/shard: {overhead:.6%}")
+
+
+def synthetic_failures(n: int, seed: int, variants: int = 20) -> List[dict]:
+    """Failures drawn from ``n // variants`` attack scripts, each reworded
+    by one word per failure, so trajectories are distinct but close to
+    others from the same script."""
+    rng = random.Random(seed)
+    vocab = [f"w{i}" for i in range(5_000)]
+    scripts = [
+        [" ".join(rng.choices(vocab, k=12)) for _ in range(rng.randint(5, 8))]
+        for _ in range(max(1, n // variants))
+    ]
+    failures = []
+    for i in range(n):
+        script = rng.choice(scripts)
+        turns = list(script)
+        t = rng.randrange(len(turns))
+        words = turns[t].split()
+        words[rng.randrange(len(words))] = rng.choice(vocab)
+        turns[t] = " ".join(words)
+        failures.append({
+            "failure_id": f"fail_{i:04d}",
+            "failure_turn": len(turns),
+            "attack_type": rng.choice(ATTACK_TYPES),
+            "harm_level": 3,
+            "trajectory": turns
+        })
+    return failures
+
+
+def bench_dedup(n: int, seed: int, threshold: float):
+    """Near-duplicate dedup time per failure as the campaign grows."""
+    print(f"{'Failures':>10}{'Tests':>9}{'Seconds':>10}{'us/failure':>12}")
+    for size in (n // 8, n // 4, n // 2, n):
+        failures = synthetic_failures(size, seed)
+        generator = TestGenerator(NearDuplicateDedup(threshold))
+        start = time.perf_counter()
+        tests = sum(1 for _ in generator.iter_tests(failures))
+        elapsed = time.perf_counter() - start
+        print(f"{size:>10,}{tests:>9,}{elapsed:>10.2f}{elapsed / size * 1e6:>12.1f}")
+    print("\nConstant us/failure means linear total time (pairwise would grow with n).")
+
+
+def synthetic_suite(n: int, seed: int):
+    """``n`` regression tests and their baseline/candidate results."""
+    rng = random.Random(seed)
+    severities = ["low", "medium", "high", "critical"]
+    tests = []
+    for i in range(n):
+        category = rng.choice(ATTACK_TYPES)
+        severity = rng.choice(severities)
+        tests.append({
+            "test_id": f"reg_{i:08x}",
+            "category": category,
+            "severity": severity,
+            "tags": [category, severity, f"turn_{rng.randint(1, 8)}"]
+        })
+    results = [
+        TestResult(t["test_id"], model, rng.random() < rate, None, 0.8)
+        for model, rate in (("v1", 0.9), ("v2", 0.85))
+        for t in tests
+    ]
+    return tests, results
+
+
+def legacy_by_category(tests: List[dict], results: List[TestResult]) -> dict:
+    """The per-category scan run_regression used before ResultAggregator."""
+    by_category = {}
+    for cat in set(t.get("category", "unknown") for t in tests):
+        cat_tests = [t for t in tests if t.get("category") == cat]
+        for model in ("v1", "v2"):
+            matched = [
+                r for r in results
+                if r.model == model and any(t["test_id"] == r.test_id for t in cat_tests)
+            ]
+            by_category[(cat, model)] = sum(r.passed for r in matched) / len(matched)
+    return by_category
+
+
+def bench_aggregate(n: int, seed: int, legacy_max: int):
+    """Per-category/severity/turn aggregation time as the suite grows."""
+    print(f"{'Tests':>10}{'Indexed s':>11}{'ns/result':>11}{'Legacy s':>10}")
+    for size in (n // 8, n // 4, n // 2, n):
+        tests, results = synthetic_suite(size, seed)
+        start = time.perf_counter()
+        aggregator = ResultAggregator(tests, ["category", "severity", "turn"])
+        aggregator.add_all(results)
+        for key in aggregator.group_by:
+            aggregator.table(key, "v1", "v2")
+        indexed = time.perf_counter() - start
+
+        legacy = ""
+        if size <= legacy_max:
+            start = time.perf_counter()
+            legacy_by_category(tests, results)
+            legacy = f"{time.perf_counter() - start:.2f}"
+        print(f"{size:>10,}{indexed:>11.2f}{indexed / len(results) * 1e9:>11.0f}{legacy:>10}")
+    print(f"\nIndexed: 3 group-by keys, linear. Legacy: category only, "
+          f"skipped above {legacy_max:,} tests.")
+
+
+def remote_run_test(latency: float, test: dict, model: str, seed: int) -> TestResult:
+    """run_test behind a simulated ``latency``-second model call."""
+    time.sleep(latency)
+    return run_test(test, model, seed)
+
+
+def bench_executor(n: int, latency: float, threads: int, seed: int):
+    """Gate wall-clock per executor for ``n`` tests on two models."""
+    tests, _ = synthetic_suite(n, seed)
+    pairs = [(t, "v1") for t in tests] + [(t, "v2") for t in tests]
+    runner = partial(remote_run_test, latency)
+    processes = os.cpu_count() or 1
+
+    print(f"{n:,} tests x 2 models, {latency * 1000:.0f} ms per model call\n")
+    print(f"{'Executor':<22}{'Seconds':>9}{'Speedup':>9}")
+    baseline = None
+    reference = None
+    for kind, workers in (("serial", 1), ("thread", threads), ("process", processes)):
+        start = time.perf_counter()
+        results = TestExecutor(kind, workers, runner=runner).run(pairs, seed)
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        reference = reference or results
+        assert results == reference, f"{kind} results differ from serial"
+        print(f"{f'{kind} x{workers}':<22}{elapsed:>9.2f}{baseline / elapsed:>8.1f}x")
+
+
+class FragileModel:
+    """Simulated models where each test fails with its own probability.
+
+    The baseline fails test ``t`` with probability ``fragility[t]``. The
+    candidate fails the ``broken`` tests (the most fragile ones, so its
+    regressions concentrate where past runs failed) 95% of the time and
+    the rest at the baseline rate. Each call sleeps ``latency`` seconds
+    and is counted per model.
+    """
+
+    def __init__(self, fragility: dict, latency: float, broken=(), candidate: str = "v2"):
+        self.fragility = fragility
+        self.latency = latency
+        self.broken = set(broken)
+        self.candidate = candidate
+        self.calls = {}
+
+    def __call__(self, test: dict, model: str, seed: int) -> TestResult:
+        time.sleep(self.latency)
+        self.calls[model] = self.calls.get(model, 0) + 1
+        rate = self.fragility[test["test_id"]]
+        if model == self.candidate and test["test_id"] in self.broken:
+            rate = 0.95
+        passed = RNGStreams(seed).test(test["test_id"], model).random() >= rate
+        return TestResult(test["test_id"], model, passed, None if passed else 4, 0.8)
+
+
+def fragile_suite(n: int, seed: int, now: datetime):
+    """``n`` tests created over the past year and each test's failure rate.
+
+    Failure rates are higher for one category and for recent tests, with
+    per-test noise, like a suite where some attack families stay brittle.
+    """
+    rng = random.Random(seed)
+    severities = ["low", "medium", "high", "critical"]
+    category_rate = {category: 0.002 for category in ATTACK_TYPES}
+    category_rate["intent_drift"] = 0.02
+    tests, fragility = [], {}
+    for i in range(n):
+        category = rng.choice(ATTACK_TYPES)
+        age_days = rng.uniform(0, 365)
+        test = {
+            "test_id": f"reg_{i:08x}",
+            "category": category,
+            "severity": rng.choice(severities),
+            "created_at": (now - timedelta(days=age_days)).isoformat()
+        }
+        tests.append(test)
+        recency = 0.5 ** (age_days / 30)
+        fragility[test["test_id"]] = min(
+            0.5, category_rate[category] * (1 + 2 * recency) * rng.lognormvariate(0, 1)
+        )
+    return tests, fragility
+
+
+def bench_priority(n: int, latency: float, past_runs: int, broken: float, batch_size: int, seed: int):
+    """Time to a certain BLOCK in suite order vs history-prioritized order.
+
+    The candidate breaks the most fragile ``broken`` share of the suite.
+    Fail-fast runs the baseline on the whole suite first, so it stops once
+    net regressions exceed the block threshold plus the baseline failures
+    still untested; prioritizing puts the broken tests first. Each mode
+    runs with a cold result cache and with the baseline already cached,
+    as in CI where the baseline rarely changes.
+    """
+    now = datetime.now()
+    tests, fragility = fragile_suite(n, seed, now)
+    ranked = sorted(fragility, key=lambda test_id: -fragility[test_id])
+    broken_tests = ranked[:round(broken * n)]
+
+    # Past gate runs, each release against the one before, all at baseline failure rates
+    history = TestHistory()
+    model = FragileModel(fragility, 0.0, candidate=None)
+    for run in range(past_runs):
+        history.record(
+            tests,
+            [model(t, f"v0.{run}", seed) for t in tests],
+            [model(t, f"v0.{run + 1}", seed) for t in tests]
+        )
+
+    print(f"{n:,} tests, {past_runs} past runs in history, {latency * 1000:.1f} ms per model call")
+    print(f"Candidate breaks the {broken:.0%} most fragile tests; fail-fast batches of {batch_size}\n")
+    print(f"{'Run':<26}{'Baseline':<10}{'v1 runs':>9}{'v2 runs':>9}{'Seconds':>9}{'Speedup':>9}  Verdict")
+    with tempfile.TemporaryDirectory() as tmp:
+        for cached in (False, True):
+            baseline = None
+            for name, fail_fast, prioritize in (
+                ("full suite", False, False),
+                ("fail-fast, suite order", True, False),
+                ("fail-fast, prioritized", True, True)
+            ):
+                model = FragileModel(fragility, latency, broken_tests)
+                cache = None
+                if cached:
+                    cache = ResultCache(os.path.join(tmp, f"cache_{name}.sqlite"), max_entries=2 * n)
+                    warm = FragileModel(fragility, 0.0)
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        run_pairs([(test, "v1") for test in tests], seed, TestExecutor(runner=warm), cache)
+                start = time.perf_counter()
+                with contextlib.redirect_stdout(io.StringIO()):
+                    verdict, _ = run_regression(
+                        "v1", "v2", "", os.path.join(tmp, "report.html"), seed,
+                        tests=tests,
+                        executor=TestExecutor(runner=model),
+                        cache=cache,
+                        fail_fast=FailFast(batch_size) if fail_fast else None,
+                        prioritize=prioritize,
+                        # A copy, as run_regression records this run's results
+                        history=copy.deepcopy(history) if prioritize else None
+                    )
+                elapsed = time.perf_counter() - start
+                if cache is not None:
+                    cache.close()
+                baseline = baseline or elapsed
+                print(f"{name:<26}{'cached' if cached else 'cold':<10}{model.calls.get('v1', 0):>9,}"
+                      f"{model.calls.get('v2', 0):>9,}{elapsed:>9.2f}{baseline / elapsed:>8.1f}x  {verdict}")
+
+
+def simulate_suite(rng: random.Random, n: int, rates, flakiness: float):
+    """Pass/fail outcomes of ``n`` tests on models with failure ``rates``.
+
+    Each test has a fixed difficulty shared by every model: a run fails
+    when the difficulty is below the model's failure rate, except that
+    with probability ``flakiness`` the run ignores it and fails at random
+    with the same rate. ``flakiness=1`` gives independent outcomes, the
+    case the two-proportion test assumes.
+    """
+    outcomes = [[] for _ in rates]
+    for _ in range(n):
+        difficulty = rng.random()
+        for runs, rate in zip(outcomes, rates):
+            draw = rng.random() if rng.random() < flakiness else difficulty
+            runs.append(draw >= rate)
+    return outcomes
+
+
+def bench_paired(baseline_fail: float, candidate_fail: float, trials: int, power: float, seed: int):
+    """Suite size for equal power: two-proportion test vs McNemar."""
+    rng = random.Random(seed)
+    print(f"Baseline fails {baseline_fail:.0%}, candidate {candidate_fail:.0%}; "
+          f"power target {power:.0%} at p < 0.05, {trials} trials per size\n")
+    print(f"{'Flakiness':>10}{'Unpaired n':>12}{'Paired n':>10}{'Executions saved':>18}")
+    for flakiness in (1.0, 0.5, 0.2, 0.05):
+        needed = {}
+        n = 50
+        while len(needed) < 2 and n <= 200_000:
+            detected = {"unpaired": 0, "paired": 0}
+            for _ in range(trials):
+                base, cand = simulate_suite(rng, n, (baseline_fail, candidate_fail), flakiness)
+                b_pass, c_pass = sum(base), sum(cand)
+                if c_pass < b_pass:
+                    detected["unpaired"] += compute_p_value(n, b_pass, n, c_pass) < 0.05
+                    regressions = sum(b and not c for b, c in zip(base, cand))
+                    improvements = sum(c and not b for b, c in zip(base, cand))
+                    detected["paired"] += mcnemar_p_value(regressions, improvements) < 0.05
+            for test, hits in detected.items():
+                if test not in needed and hits / trials >= power:
+                    needed[test] = n
+            n = int(n * 1.25)
+        unpaired, paired = needed.get("unpaired"), needed.get("paired")
+        saved = f"{1 - paired / unpaired:.0%}" if unpaired and paired else "n/a"
+        print(f"{flakiness:>10.2f}{unpaired or 0:>12,}{paired or 0:>10,}{saved:>18}")
+    print("\nEach suite size runs every test on both models (2n executions).")
+
+
+def bench_bootstrap(n: int, resamples: int, naive_resamples: int, seed: int):
+    """Per-category bootstrap intervals: naive index resampling vs the engine."""
+    tests, results = synthetic_suite(n, seed)
+    base, cand = results[:n], results[n:]
+    categories = {category: i for i, category in enumerate(ATTACK_TYPES)}
+    groups = [categories[t["category"]] for t in tests]
+    rng = random.Random(seed)
+
+    print(f"{n:,} tests, {len(categories)} categories\n")
+    print(f"{'Method':<28}{'Resamples':>10}{'Seconds':>10}{'Projected':>11}")
+
+    start = time.perf_counter()
+    diffs = [c.passed - b.passed for b, c in zip(base, cand)]
+    members = [[i for i, g in enumerate(groups) if g == k] for k in range(len(categories))]
+    for _ in range(naive_resamples):
+        for idx in members:
+            sum(diffs[rng.choice(idx)] for _ in idx)
+    elapsed = time.perf_counter() - start
+    print(f"{'naive (python, per test)':<28}{naive_resamples:>10,}{elapsed:>10.2f}"
+          f"{elapsed * resamples / naive_resamples:>10.0f}s")
+
+    for name, np_module in (("engine (pure python)", None), ("engine (numpy)", bootstrap.np)):
+        if name.endswith("(numpy)") and np_module is None:
+            print(f"{name:<28}{'numpy not installed':>31}")
+            continue
+        saved, bootstrap.np = bootstrap.np, np_module
+        try:
+            start = time.perf_counter()
+            counts = bootstrap.group_counts(
+                [r.passed for r in base], [r.passed for r in cand], groups, len(categories)
+            )
+            overall, _ = bootstrap.delta_intervals(counts, resamples, seed=seed)
+            elapsed = time.perf_counter() - start
+        finally:
+            bootstrap.np = saved
+        print(f"{name:<28}{resamples:>10,}{elapsed:>10.2f}{'':>11}  overall "
+              f"[{overall[0]:+.4f}, {overall[1]:+.4f}]")
+
+
+def bench_matrix(n: int, pool_tests: int, seed: int):
+    """Gate statistics from TestResult lists vs the results matrix, and
+    process workers returning results vs writing to shared memory."""
+    tests, results = synthetic_suite(n, seed)
+    base, cand = results[:n], results[n:]
+
+    print(f"{n:,} tests x 2 models\n")
+    print(f"{'Statistics':<34}{'Seconds':>9}")
+    start = time.perf_counter()
+    b_pass = sum(1 for r in base if r.passed)
+    c_pass = sum(1 for r in cand if r.passed)
+    aggregator = ResultAggregator(tests)
+    aggregator.add_all(results)
+    aggregator.table("category", "v1", "v2")
+    reference = (b_pass, c_pass, paired_counts(base, cand))
+    print(f"{'TestResult lists':<34}{time.perf_counter() - start:>9.3f}")
+
+    matrix = results_matrix(tests, ["v1", "v2"], [base, cand])
+    for label, np_module in (("matrix (int bitsets)", None), ("matrix (numpy)", matrix_module.np)):
+        if label.endswith("(numpy)") and np_module is None:
+            print(f"{label:<34}{'numpy not installed':>20}")
+            continue
+        saved, matrix_module.np = matrix_module.np, np_module
+        try:
+            start = time.perf_counter()
+            matrix._masks = None
+            stats = (
+                matrix.pass_count("v1"), matrix.pass_count("v2"), matrix.discordant("v1", "v2")
+            )
+            matrix.category_table("v1", "v2")
+            elapsed = time.perf_counter() - start
+        finally:
+            matrix_module.np = saved
+        assert stats == reference, f"{label} disagrees with the list statistics"
+        print(f"{label:<34}{elapsed:>9.3f}")
+
+    pairs = [(t, model) for model in ("v1", "v2") for t in tests[:pool_tests]]
+    workers = os.cpu_count() or 1
+    print(f"\n{pool_tests:,} tests x 2 models on {workers} processes")
+    print(f"{'Process pool':<34}{'Seconds':>9}")
+    start = time.perf_counter()
+    returned = TestExecutor("process", workers).run(pairs, seed)
+    print(f"{'return TestResults':<34}{time.perf_counter() - start:>9.3f}")
+
+    shared = results_matrix(tests[:pool_tests], ["v1", "v2"], shared=True)
+    try:
+        cells = [shared.cell(model, i) for model in ("v1", "v2") for i in range(pool_tests)]
+        start = time.perf_counter()
+        TestExecutor("process", workers).fill(shared, pairs, cells, seed)
+        elapsed = time.perf_counter() - start
+        assert bytes(shared.cells) == bytes(r.passed for r in returned), "shared matrix differs"
+        print(f"{'write to shared matrix':<34}{elapsed:>9.3f}")
+    finally:
+        shared.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the stress test and release gate pipeline"
+    )
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    memory = subparsers.add_parser("memory", help="Failure / TestResult memory footprint")
+    memory.add_argument("--n", type=int, default=1_000_000, help="Records of each type")
+    memory.add_argument("--seed", type=int, default=42, help="Random seed")
+
+    progress = subparsers.add_parser("progress", help="Progress instrumentation overhead")
+    progress.add_argument("--rollouts", type=int, default=200_000, help="Rollouts to time")
+    progress.add_argument("--seed", type=int, default=42, help="Random seed")
+
+    dedup = subparsers.add_parser("dedup", help="Near-duplicate dedup scaling")
+    dedup.add_argument("--n", type=int, default=100_000, help="Largest campaign size")
+    dedup.add_argument("--threshold", type=float, default=0.8, help="Similarity threshold")
+    dedup.add_argument("--seed", type=int, default=42, help="Random seed")
+
+    aggregate = subparsers.add_parser("aggregate", help="Release gate per-group aggregation scaling")
+    aggregate.add_argument("--n", type=int, default=1_000_000, help="Largest suite size")
+    aggregate.add_argument(
+        "--legacy-max", type=int, default=4_000, help="Largest suite to time the legacy scan on"
+    )
+    aggregate.add_argument("--seed", type=int, default=42, help="Random seed")
+
+    executor = subparsers.add_parser("executor", help="Release gate executor wall-clock")
+    executor.add_argument("--tests", type=int, default=2_000, help="Suite size")
+    executor.add_argument("--latency", type=float, default=0.005, help="Seconds per model call")
+    executor.add_argument("--threads", type=int, default=32, help="Thread pool size")
+    executor.add_argument("--seed", type=int, default=42, help="Random seed")
+
+    priority = subparsers.add_parser("priority", help="Release gate time to a certain BLOCK")
+    priority.add_argument("--tests", type=int, default=20_000, help="Suite size")
+    priority.add_argument("--latency", type=float, default=0.001, help="Seconds per model call")
+    priority.add_argument("--past-runs", type=int, default=3, help="Gate runs in the history")
+    priority.add_argument("--broken", type=float, default=0.1, help="Share of tests the candidate breaks")
+    priority.add_argument("--batch-size", type=int, default=10, help="Tests per batch")
+    priority.add_argument("--seed", type=int, default=42, help="Random seed")
+
+    paired = subparsers.add_parser("paired", help="Executions for equal power, paired vs unpaired")
+    paired.add_argument("--baseline-fail", type=float, default=0.08, help="Baseline failure rate")
+    paired.add_argument("--candidate-fail", type=float, default=0.13, help="Candidate failure rate")
+    paired.add_argument("--trials", type=int, default=400, help="Simulated gate runs per suite size")
+    paired.add_argument("--power", type=float, default=0.8, help="Target detection rate")
+    paired.add_argument("--seed", type=int, default=42, help="Random seed")
+
+    boot = subparsers.add_parser("bootstrap", help="Bootstrap delta interval cost")
+    boot.add_argument("--n", type=int, default=100_000, help="Suite size")
+    boot.add_argument("--resamples", type=int, default=10_000, help="Bootstrap resamples")
+    boot.add_argument(
+        "--naive-resamples", type=int, default=3, help="Resamples to time the naive loop on"
+    )
+    boot.add_argument("--seed", type=int, default=42, help="Random seed")
+
+    matrix = subparsers.add_parser("matrix", help="Results matrix statistics and shared-memory workers")
+    matrix.add_argument("--n", type=int, default=1_000_000, help="Suite size for statistics")
+    matrix.add_argument("--pool-tests", type=int, default=200_000, help="Suite size for the process pool")
+    matrix.add_argument("--seed", type=int, default=42, help="Random seed")
+
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"BENCHMARK: {args.benchmark.upper()}")
+    print("=" * 60)
+
+    if args.benchmark == "memory":
+        bench_memory(args.n, args.seed)
+    elif args.benchmark == "progress":
+        bench_progress(args.rollouts, args.seed)
+    elif args.benchmark == "dedup":
+        bench_dedup(args.n, args.seed, args.threshold)
+    elif args.benchmark == "aggregate":
+        bench_aggregate(args.n, args.seed, args.legacy_max)
+    elif args.benchmark == "executor":
+        bench_executor(args.tests, args.latency, args.threads, args.seed)
+    elif args.benchmark == "priority":
+        bench_priority(
+            args.tests, args.latency, args.past_runs, args.broken, args.batch_size, args.seed
+        )
+    elif args.benchmark == "paired":
+        bench_paired(args.baseline_fail, args.candidate_fail, args.trials, args.power, args.seed)
+    elif args.benchmark == "bootstrap":
+        bench_bootstrap(args.n, args.resamples, args.naive_resamples, args.seed)
+    elif args.benchmark == "matrix":
+        bench_matrix(args.n, args.pool_tests, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Bootstrap Intervals for Release Gate Deltas
+
+Confidence intervals for the candidate-minus-baseline pass-rate delta,
+overall and per group (e.g. category), from one stratified paired
+bootstrap: each resample redraws every group's tests with replacement,
+keeping each test's baseline and candidate outcome together, and the
+overall delta is the resample's total over all groups.
+
+A test's paired difference is -1 (regression), 0 or +1 (improvement), so
+a group's resampled delta depends only on how many of each were drawn:
+a multinomial draw from the group's counts. With NumPy, all groups of a
+chunk of resamples are drawn in one call, so cost and memory grow with
+resamples x groups and not with suite size; 10k resamples of a 100k-test
+suite take milliseconds. Without NumPy, small groups are resampled test
+by test and large ones from the multinomial's normal limit.
+
+Usage:
+    counts = group_counts(baseline_passed, candidate_passed, group_index, n_groups)
+    overall, by_group = delta_intervals(counts, resamples=10_000)
+"""
+
+import math
+import random
+import sys
+from pathlib import Path
+from typing import List, Sequence, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from rng_streams import derive_seed
+
+try:
+    import numpy as np
+except ImportError:  # optional: vectorizes resampling when available
+    np = None
+
+RESAMPLES = 1000
+
+# Resamples drawn per NumPy call; bounds memory at CHUNK x groups x 3 counts
+CHUNK = 4096
+
+# Pure-Python path: largest group resampled test by test
+EXACT_MAX = 2000
+
+Interval = Tuple[float, float]
+
+
+def group_counts(
+    baseline: Sequence[bool],
+    candidate: Sequence[bool],
+    groups: Sequence[int],
+    n_groups: int
+) -> List[Tuple[int, int, int]]:
+    """``(regressions, ties, improvements)`` per group from per-test
+    pass/fail columns and each test's group index."""
+    if np is not None:
+        diffs = np.asarray(candidate, dtype=np.int64) - np.asarray(baseline, dtype=np.int64)
+        flat = np.bincount(np.asarray(groups, dtype=np.int64) * 3 + diffs + 1, minlength=n_groups * 3)
+        return [tuple(row) for row in flat.reshape(n_groups, 3).tolist()]
+    counts = [[0, 0, 0] for _ in range(n_groups)]
+    for b, c, g in zip(baseline, candidate, groups):
+        counts[g][int(c) - int(b) + 1] += 1
+    return [tuple(row) for row in counts]
+
+
+def _quantiles(values: List[float], confidence: float) -> Interval:
+    values = sorted(values)
+    tail = (1 - confidence) / 2
+    n = len(values)
+    return values[int(tail * n)], values[min(n - 1, math.ceil((1 - tail) * n) - 1)]
+
+
+def _resample_sums_python(counts: Tuple[int, int, int], resamples: int, rng: random.Random) -> List[float]:
+    """Resampled sums of one group's paired differences."""
+    regressions, ties, improvements = counts
+    n = regressions + ties + improvements
+    if n == 0:
+        return [0] * resamples
+    if n <= EXACT_MAX:
+        cum_weights = (regressions, regressions + ties, n)
+        return [
+            sum(rng.choices((-1, 0, 1), cum_weights=cum_weights, k=n))
+            for _ in range(resamples)
+        ]
+    mean = (improvements - regressions) / n
+    sd = math.sqrt(n * ((regressions + improvements) / n - mean * mean))
+    return [rng.gauss(n * mean, sd) for _ in range(resamples)]
+
+
+def delta_intervals(
+    counts: List[Tuple[int, int, int]],
+    resamples: int = RESAMPLES,
+    confidence: float = 0.95,
+    seed: int = 42,
+    chunk: int = CHUNK
+) -> Tuple[Interval, List[Interval]]:
+    """Percentile intervals for the overall delta and each group's delta.
+
+    ``counts`` holds ``(regressions, ties, improvements)`` per group, as
+    returned by ``group_counts``. Empty groups get a ``(0.0, 0.0)``
+    interval.
+    """
+    sizes = [sum(row) for row in counts]
+    total = sum(sizes)
+    if total == 0:
+        return (0.0, 0.0), [(0.0, 0.0)] * len(counts)
+
+    if np is not None:
+        rng = np.random.default_rng(derive_seed(seed, "bootstrap"))
+        n = np.array(sizes, dtype=np.int64)
+        pvals = np.array(counts, dtype=np.float64) / np.maximum(n, 1)[:, None]
+        # Column 0: overall; columns 1..G: groups
+        deltas = np.empty((resamples, len(counts) + 1))
+        for start in range(0, resamples, chunk):
+            size = min(chunk, resamples - start)
+            draws = rng.multinomial(n, pvals, size=(size, len(counts)))
+            sums = draws[..., 2] - draws[..., 0]
+            deltas[start:start + size, 0] = sums.sum(axis=1) / total
+            deltas[start:start + size, 1:] = sums / np.maximum(n, 1)
+        tail = (1 - confidence) / 2
+        low, high = np.quantile(deltas, [tail, 1 - tail], axis=0, method="inverted_cdf")
+        intervals = list(zip(low.tolist(), high.tolist()))
+        return intervals[0], intervals[1:]
+
+    rng = random.Random(derive_seed(seed, "bootstrap"))
+    group_sums = [_resample_sums_python(row, resamples, rng) for row in counts]
+    overall = [sum(sums) / total for sums in zip(*group_sums)]
+    by_group = [
+        _quantiles([s / size for s in sums], confidence) if size else (0.0, 0.0)
+        for sums, size in zip(group_sums, sizes)
+    ]
+    return _quantiles(overall, confidence), by_group
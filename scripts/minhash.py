@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+MinHash / LSH Near-Duplicate Index
+
+Finds texts whose word-shingle sets have Jaccard similarity above a
+threshold without comparing every pair. Each text gets a MinHash
+signature; signatures are split into bands, and only texts sharing a band
+bucket are compared, so a lookup touches a handful of candidates however
+many texts are indexed.
+
+Used by step 2 to collapse regression tests whose attack trajectories are
+the same attack with small wording changes.
+
+Usage:
+    index = LSHIndex(threshold=0.8)
+    signature = index.signature(text)
+    match = index.query(signature)   # key of a near-duplicate, or None
+    if match is None:
+        index.add("reg_1a2b3c4d", signature)
+"""
+
+import hashlib
+import random
+from array import array
+import re
+from typing import Dict, List, Optional, Set, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # optional: vectorizes signatures when available
+    np = None
+
+# Universal hash family (a * x + b) mod P over 32-bit shingle hashes.
+# With a, b, x < 2**32 the product fits in 64 bits, so the NumPy path
+# computes exactly the same signatures as the pure-Python one.
+MERSENNE_PRIME = (1 << 61) - 1
+MAX_HASH = 1 << 32
+
+NUM_PERM = 128
+SHINGLE_SIZE = 3
+
+_TOKEN = re.compile(r"\w+")
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> Set[str]:
+    """Set of ``size``-word shingles of ``text`` (lowercased, punctuation dropped)."""
+    tokens = _TOKEN.findall(text.lower())
+    if len(tokens) <= size:
+        return {" ".join(tokens)}
+    return {" ".join(tokens[i:i + size]) for i in range(len(tokens) - size + 1)}
+
+
+def lsh_params(threshold: float, num_perm: int) -> Tuple[int, int]:
+    """(bands, rows) with ``bands * rows == num_perm`` whose S-curve
+    midpoint ``(1 / bands) ** (1 / rows)`` is closest to ``threshold``."""
+    options = [(num_perm // rows, rows) for rows in range(1, num_perm + 1) if num_perm % rows == 0]
+    return min(options, key=lambda br: abs((1 / br[0]) ** (1 / br[1]) - threshold))
+
+
+class LSHIndex:
+    """Banded MinHash index over shingle sets.
+
+    A candidate from a shared band bucket is only reported as a match if
+    its estimated Jaccard similarity (the fraction of equal signature
+    slots) reaches ``threshold``. Signatures are deterministic for a given
+    ``seed``, so results do not depend on the process or insertion timing.
+
+    Indexed signatures are packed into 64-bit arrays and band buckets are
+    keyed by the band's hash, so each entry costs about ``8 * num_perm``
+    bytes plus one bucket slot per band.
+    """
+
+    def __init__(self, threshold: float = 0.8, num_perm: int = NUM_PERM, seed: int = 1):
+        if not 0 < threshold <= 1:
+            raise ValueError(f"threshold must be in (0, 1], got {threshold}")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands, self.rows = lsh_params(threshold, num_perm)
+        rng = random.Random(seed)
+        self._perms = [
+            (rng.randrange(1, MAX_HASH), rng.randrange(0, MAX_HASH))
+            for _ in range(num_perm)
+        ]
+        if np is not None:
+            self._a = np.array([a for a, _ in self._perms], dtype=np.uint64)[:, None]
+            self._b = np.array([b for _, b in self._perms], dtype=np.uint64)[:, None]
+        self._buckets: List[Dict[int, List[str]]] = [{} for _ in range(self.bands)]
+        self._signatures: Dict[str, array] = {}
+
+    def signature(self, text: str) -> Tuple[int, ...]:
+        """MinHash signature of ``text``'s shingle set."""
+        hashes = [
+            int.from_bytes(hashlib.blake2b(s.encode(), digest_size=4).digest(), "big")
+            for s in shingles(text)
+        ]
+        if np is not None:
+            x = np.array(hashes, dtype=np.uint64)[None, :]
+            return tuple(((self._a * x + self._b) % MERSENNE_PRIME).min(axis=1).tolist())
+        return tuple(
+            min((a * x + b) % MERSENNE_PRIME for x in hashes)
+            for a, b in self._perms
+        )
+
+    def _bands(self, signature: Tuple[int, ...]):
+        # Hashes of int tuples are not randomized per process
+        for band in range(self.bands):
+            yield band, hash(signature[band * self.rows:(band + 1) * self.rows])
+
+    def similarity(self, a, b) -> float:
+        """Estimated Jaccard similarity of two signatures."""
+        return sum(x == y for x, y in zip(a, b)) / self.num_perm
+
+    def query(self, signature: Tuple[int, ...]) -> Optional[str]:
+        """Key of the first indexed near-duplicate of ``signature``, or None."""
+        checked = set()
+        for band, value in self._bands(signature):
+            for key in self._buckets[band].get(value, ()):
+                if key in checked:
+                    continue
+                checked.add(key)
+                if self.similarity(signature, self._signatures[key]) >= self.threshold:
+                    return key
+        return None
+
+    def add(self, key: str, signature: Tuple[int, ...]):
+        """Index ``signature`` under ``key``."""
+        self._signatures[key] = array("Q", signature)
+        for band, value in self._bands(signature):
+            self._buckets[band].setdefault(value, []).append(key)
+
+    def __len__(self) -> int:
+        return len(self._signatures)
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Model Clients for Live Rollouts
+
+The async rollout driver in step 1 (``--backend async``) talks to a model
+through the small ``ModelClient`` interface defined here, so a real
+endpoint can be plugged in without touching the driver.
+
+Two implementations ship with the demo:
+
+- ``StubModelClient`` answers in-process after a simulated network delay.
+  Configured with the campaign's mode and seed it fails exactly where the
+  simulator does, so async campaigns reproduce simulated reports.
+- ``JsonLineModelClient`` speaks newline-delimited JSON over TCP to an
+  endpoint such as the stub server started by this script.
+
+Usage:
+    # Serve the stub model on localhost:8765
+    python scripts/model_client.py --port 8765 --latency 0.05
+
+    # Point step 1 at it
+    python scripts/step1_run_stress_tests.py --backend async --endpoint localhost:8765
+
+Wire format (one JSON object per line, one request in flight per connection):
+    request:  {"conversation_id": 17, "messages": [{"role": "user", "content": "..."}, ...]}
+    response: {"text": "...", "harm_level": null}
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from step1_run_stress_tests import _run_rollout
+
+
+@dataclass
+class ModelReply:
+    """One model turn.
+
+    ``harm_level`` is set when the endpoint's safety classifier flags the
+    response as a policy violation, and None for a safe response.
+    """
+    text: str
+    harm_level: Optional[int] = None
+
+
+class ModelClient(ABC):
+    """Interface for a model endpoint used by the async rollout driver.
+
+    Subclasses must implement ``respond``; ``close`` is optional.
+    """
+
+    name = "client"
+
+    @abstractmethod
+    async def respond(self, conversation_id: int, messages: List[Dict]) -> ModelReply:
+        """Return the model's reply to the last user message.
+
+        Raises ``ValueError`` if the endpoint's reply cannot be parsed.
+        """
+
+    async def close(self):
+        """Release connections. Called once the campaign finishes."""
+
+
+class StubModelClient(ModelClient):
+    """Local stand-in for a model endpoint.
+
+    Each call sleeps for ``latency`` seconds, then replays the simulated
+    rollout for ``conversation_id``: the reply is flagged on the turn where
+    the simulator would record the failure.
+    """
+
+    name = "stub"
+
+    def __init__(self, mode: str, seed: int, latency: float = 0.05):
+        self.mode = mode
+        self.seed = seed
+        self.latency = latency
+
+    async def respond(self, conversation_id: int, messages: List[Dict]) -> ModelReply:
+        await asyncio.sleep(self.latency)
+        turn = sum(1 for m in messages if m["role"] == "user")
+        _, failure = _run_rollout(self.mode, conversation_id, self.seed)
+        if failure is not None and failure.failure_turn == turn:
+            return ModelReply(failure.model_responses[-1], failure.harm_level)
+        return ModelReply(f"Turn {turn}: [redacted response]")
+
+
+class JsonLineModelClient(ModelClient):
+    """Client for an endpoint speaking newline-delimited JSON over TCP.
+
+    Connections are reused across requests; at most one request is in
+    flight per connection, so the pool grows to the driver's concurrency.
+    A connection whose request failed or timed out is closed rather than
+    reused.
+    """
+
+    name = "jsonl"
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self._idle: List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+
+    async def respond(self, conversation_id: int, messages: List[Dict]) -> ModelReply:
+        if self._idle:
+            reader, writer = self._idle.pop()
+        else:
+            reader, writer = await asyncio.open_connection(self.host, self.port)
+
+        try:
+            request = {"conversation_id": conversation_id, "messages": messages}
+            writer.write(json.dumps(request).encode() + b"\n")
+            await writer.drain()
+            line = await reader.readline()
+            if not line:
+                raise ConnectionError(f"{self.host}:{self.port} closed the connection")
+        except BaseException:
+            # Includes cancellation by a turn timeout: the reply may still arrive
+            writer.close()
+            raise
+
+        # The whole line was read, so the connection can be reused even if
+        # the reply is malformed
+        self._idle.append((reader, writer))
+        try:
+            data = json.loads(line)
+            return ModelReply(data["text"], data.get("harm_level"))
+        except (KeyError, TypeError, AttributeError) as e:
+            raise ValueError(f"Malformed reply from {self.host}:{self.port}: {line[:200]!r}") from e
+
+    async def close(self):
+        while self._idle:
+            _, writer = self._idle.pop()
+            writer.close()
+            await writer.wait_closed()
+
+
+def parse_endpoint(endpoint: str) -> Tuple[str, int]:
+    """Split ``HOST:PORT``."""
+    host, _, port = endpoint.rpartition(":")
+    if not host or not port.isdigit():
+        raise ValueError(f"Endpoint must be HOST:PORT, got {endpoint!r}")
+    return host, int(port)
+
+
+async def serve_stub(host: str, port: int, stub: StubModelClient):
+    """Serve ``stub`` over the JSON-lines protocol until cancelled."""
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while line := await reader.readline():
+                request = json.loads(line)
+                reply = await stub.respond(request["conversation_id"], request["messages"])
+                response = {"text": reply.text, "harm_level": reply.harm_level}
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, host, port)
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Serve the stub model endpoint for async stress tests"
+    )
+    parser.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="Interface to listen on"
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=8765,
+        help="Port to listen on"
+    )
+    parser.add_argument(
+        "--mode",
+        choices=["static", "adaptive"],
+        default="adaptive",
+        help="Failure profile to replay"
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=42,
+        help="Random seed (match step 1's --seed to reproduce simulated reports)"
+    )
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.05,
+        help="Seconds per model turn"
+    )
+
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("STUB MODEL ENDPOINT")
+    print("=" * 60)
+    print(f"Listening on {args.host}:{args.port} ({args.mode}, seed {args.seed}, "
+          f"{args.latency * 1000:.0f} ms/turn)")
+
+    stub = StubModelClient(args.mode, args.seed, args.latency)
+    try:
+        asyncio.run(serve_stub(args.host, args.port, stub))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Persistent Release Gate Result Cache
+
+Stores test results in SQLite keyed by (test content hash, model version,
+runner config). A test whose content is unchanged gives the same result
+on the same model version, so a gate run only executes tests that are new
+or have changed, plus anything run against a new model version (usually
+the candidate).
+
+The cache keeps at most ``max_entries`` results and evicts the least
+recently used. Entries can be exported to JSONL and imported elsewhere
+so CI jobs can share a warm cache; imports keep the exported recency
+order.
+
+Usage:
+    cache = ResultCache("artifacts/gate_cache.sqlite")
+    key = cache.key(test, "v1", {"seed": 42})
+    cached = cache.get_many([key])
+    cache.put_many({key: result})
+    cache.close()
+"""
+
+import json
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from test_store import content_digest
+
+MAX_ENTRIES = 1_000_000
+
+# Keys per SQL statement (stays under SQLite's bound-parameter limit)
+BATCH = 500
+
+
+class ResultCache:
+    """SQLite-backed LRU cache of gate results."""
+
+    def __init__(self, path: str, max_entries: int = MAX_ENTRIES):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.max_entries = max_entries
+        self.db = sqlite3.connect(path)
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            " key TEXT PRIMARY KEY, test_id TEXT, model TEXT, passed INTEGER,"
+            " failure_turn INTEGER, confidence REAL, last_used INTEGER)"
+        )
+        self.db.execute("CREATE INDEX IF NOT EXISTS results_lru ON results (last_used)")
+        # Logical clock for recency; survives restarts via the stored maximum
+        self.clock = self.db.execute("SELECT COALESCE(MAX(last_used), 0) FROM results").fetchone()[0]
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key(test: Dict, model: str, config: Dict) -> str:
+        """Cache key for running ``test`` on ``model`` with runner ``config``."""
+        return content_digest({"test": content_digest(test), "model": model, "config": config})
+
+    def _tick(self) -> int:
+        self.clock += 1
+        return self.clock
+
+    def get_many(self, keys: List[str]) -> Dict[str, tuple]:
+        """Cached ``(test_id, model, passed, failure_turn, confidence)`` rows by key."""
+        found = {}
+        for i in range(0, len(keys), BATCH):
+            batch = keys[i:i + BATCH]
+            rows = self.db.execute(
+                "SELECT key, test_id, model, passed, failure_turn, confidence FROM results"
+                f" WHERE key IN ({','.join('?' * len(batch))})",
+                batch
+            )
+            for key, test_id, model, passed, failure_turn, confidence in rows:
+                found[key] = (test_id, model, bool(passed), failure_turn, confidence)
+        now = self._tick()
+        self.db.executemany(
+            "UPDATE results SET last_used = ? WHERE key = ?", ((now, key) for key in found)
+        )
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return found
+
+    def put_many(self, rows: Dict[str, tuple], ordered: bool = False):
+        """Store ``(test_id, model, passed, failure_turn, confidence)`` rows by key.
+
+        With ``ordered``, rows are stamped with increasing ticks in the
+        order given (least recently used first) instead of one shared tick.
+        """
+        if ordered:
+            first = self.clock + 1
+            self.clock += len(rows)
+            stamped = ((key, *row, first + i) for i, (key, row) in enumerate(rows.items()))
+        else:
+            now = self._tick()
+            stamped = ((key, *row, now) for key, row in rows.items())
+        self.db.executemany("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?)", stamped)
+        self._evict()
+
+    def _evict(self):
+        """Drop least recently used entries beyond ``max_entries``."""
+        excess = self.db.execute("SELECT COUNT(*) FROM results").fetchone()[0] - self.max_entries
+        if excess > 0:
+            self.db.execute(
+                "DELETE FROM results WHERE key IN"
+                " (SELECT key FROM results ORDER BY last_used LIMIT ?)",
+                (excess,)
+            )
+            self.evictions += excess
+
+    def __len__(self) -> int:
+        return self.db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def export(self, path: str) -> int:
+        """Write every entry to a JSONL file, least recently used first;
+        return the number written."""
+        count = 0
+        with open(path, "w") as f:
+            for row in self.db.execute("SELECT * FROM results ORDER BY last_used, rowid"):
+                key, test_id, model, passed, failure_turn, confidence, last_used = row
+                f.write(json.dumps({
+                    "key": key, "test_id": test_id, "model": model, "passed": bool(passed),
+                    "failure_turn": failure_turn, "confidence": confidence,
+                    "last_used": last_used
+                }) + "\n")
+                count += 1
+        return count
+
+    def import_entries(self, path: str) -> int:
+        """Merge entries from an exported JSONL file; return the number read.
+
+        Imported entries become the most recently used, in their exported
+        recency order, so eviction still drops the stalest of them first.
+        """
+        entries = []
+        with open(path) as f:
+            for n, line in enumerate(f):
+                entry = json.loads(line)
+                # Older exports carry no tick; their file order is recency order
+                entries.append((entry.get("last_used", 0), n, entry))
+        entries.sort(key=lambda item: item[:2])
+        rows = {}
+        for _, _, entry in entries:
+            rows.pop(entry["key"], None)
+            rows[entry["key"]] = (
+                entry["test_id"], entry["model"], entry["passed"],
+                entry["failure_turn"], entry["confidence"]
+            )
+        self.put_many(rows, ordered=True)
+        return len(rows)
+
+    def stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": len(self)
+        }
+
+    def close(self):
+        self.db.commit()
+        self.db.close()
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Release Gate Results Matrix
+
+Pass/fail outcomes of every test on every model, stored as a
+``models x tests`` matrix of one-byte cells (the layout of a NumPy bool
+array) with a per-test category index alongside. Gate statistics are
+whole-row operations rather than loops over ``TestResult`` objects:
+
+- with NumPy, rows are bool arrays: pass counts are sums and per-category
+  counts one ``bincount``;
+- without it, each row is packed into an integer bitset (bit ``i`` is
+  test ``i``), so counts are ``int.bit_count()`` of a row ANDed with a
+  category mask, and discordant pairs come from ``a & ~b``.
+
+The matrix can live in shared memory, so workers in a process pool write
+their outcomes straight into it (one byte per cell, so concurrent writers
+never share a read-modify-write) instead of sending results back.
+
+Usage:
+    matrix = ResultsMatrix(["v1", "v2"], categories)
+    matrix.set("v2", 17, passed=False)
+    table = matrix.category_table("v1", "v2")
+    counts = matrix.group_counts("v1", "v2")
+    regressions, improvements = matrix.discordant("v1", "v2", stop=500)
+"""
+
+from array import array
+from multiprocessing import shared_memory
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # optional: vectorizes row statistics when available
+    np = None
+
+# Cell bytes 0/1 -> ASCII '0'/'1', for packing a row into an int bitset
+_BITS = bytes.maketrans(b"\x00\x01", b"01")
+
+
+def _pack(cells: bytes) -> int:
+    """Integer whose bit ``i`` is cell ``i``."""
+    return int(cells.translate(_BITS)[::-1], 2) if cells else 0
+
+
+class ResultsMatrix:
+    """``models x tests`` pass/fail cells plus a per-test category index.
+
+    With ``shared=True`` the cells live in a ``SharedMemory`` block named
+    ``self.name``; call ``close()`` when done (the creator also unlinks
+    it).
+    """
+
+    def __init__(
+        self,
+        models: Sequence[str],
+        categories: Sequence[str],
+        shared: bool = False
+    ):
+        self.models = list(models)
+        self.rows = {model: i for i, model in enumerate(self.models)}
+        self.n_tests = len(categories)
+        self._index(categories)
+
+        size = len(self.models) * self.n_tests
+        self._shm = None
+        if shared:
+            self._shm = shared_memory.SharedMemory(create=True, size=max(1, size))
+            self.cells = self._shm.buf[:size]
+            self.cells[:] = bytes(size)
+        else:
+            self.cells = memoryview(bytearray(size))
+
+    def _index(self, categories: Sequence[str]):
+        # Categories in order of first appearance; category_index[i] is test i's
+        self.categories: List[str] = list(dict.fromkeys(categories))
+        ids = {category: i for i, category in enumerate(self.categories)}
+        self.category_index = array("H", (ids[category] for category in categories))
+        self._masks: Optional[List[int]] = None
+
+    @property
+    def name(self) -> Optional[str]:
+        """Shared memory block name, for workers to attach to."""
+        return self._shm.name if self._shm is not None else None
+
+    @classmethod
+    def from_results(
+        cls,
+        categories: Sequence[str],
+        models: Sequence[str],
+        results: Iterable[Sequence]
+    ) -> "ResultsMatrix":
+        """Matrix of ``results[k][i]``, the result of test ``i`` on
+        ``models[k]`` (anything with a ``passed`` attribute)."""
+        matrix = cls(models, categories)
+        for row, row_results in enumerate(results):
+            start = row * matrix.n_tests
+            matrix.cells[start:start + matrix.n_tests] = bytes(r.passed for r in row_results)
+        return matrix
+
+    def head(self, n: int) -> "ResultsMatrix":
+        """Copy of the first ``n`` tests (e.g. those an early-stopped run executed)."""
+        matrix = ResultsMatrix(self.models, [self.categories[i] for i in self.category_index[:n]])
+        for model in self.models:
+            matrix._row(model)[:] = self._row(model, 0, n)
+        return matrix
+
+    def regroup(self, groups: Sequence[str]) -> "ResultsMatrix":
+        """View of the same cells grouped by ``groups[i]`` instead of
+        category, for breakdowns by other test fields."""
+        matrix = ResultsMatrix.__new__(ResultsMatrix)
+        matrix.models, matrix.rows, matrix.n_tests = self.models, self.rows, self.n_tests
+        matrix.cells, matrix._shm = self.cells, None
+        matrix._index(groups)
+        return matrix
+
+    def cell(self, model: str, test: int) -> int:
+        """Flat cell index of ``test`` on ``model``."""
+        return self.rows[model] * self.n_tests + test
+
+    def set(self, model: str, test: int, passed: bool):
+        self.cells[self.cell(model, test)] = passed
+
+    def row(self, model: str) -> memoryview:
+        """Cells of ``model``, one 0/1 byte per test."""
+        return self._row(model)
+
+    def _row(self, model: str, start: int = 0, stop: Optional[int] = None):
+        offset = self.rows[model] * self.n_tests
+        stop = self.n_tests if stop is None else stop
+        return self.cells[offset + start:offset + stop]
+
+    def _array(self, model: str, start: int = 0, stop: Optional[int] = None):
+        return np.frombuffer(self._row(model, start, stop), dtype=np.bool_)
+
+    def _bits(self, model: str, start: int = 0, stop: Optional[int] = None) -> int:
+        return _pack(bytes(self._row(model, start, stop)))
+
+    def _category_masks(self) -> List[int]:
+        """Bitset of each category's tests, built once."""
+        if self._masks is None:
+            if len(self.categories) <= 256:
+                codes = bytes(self.category_index.tolist())
+                self._masks = [
+                    _pack(codes.translate(bytes(i == category for i in range(256))))
+                    for category in range(len(self.categories))
+                ]
+            else:
+                self._masks = [
+                    _pack(bytes(c == category for c in self.category_index))
+                    for category in range(len(self.categories))
+                ]
+        return self._masks
+
+    def category_sizes(self) -> List[int]:
+        if np is not None:
+            return np.bincount(
+                np.frombuffer(self.category_index, dtype=np.uint16), minlength=len(self.categories)
+            ).tolist()
+        return [mask.bit_count() for mask in self._category_masks()]
+
+    def pass_count(self, model: str, start: int = 0, stop: Optional[int] = None) -> int:
+        """Passes of ``model`` on tests ``start:stop`` (all by default)."""
+        if np is not None:
+            return int(np.count_nonzero(self._array(model, start, stop)))
+        return self._bits(model, start, stop).bit_count()
+
+    def pass_rate(self, model: str) -> float:
+        return self.pass_count(model) / self.n_tests if self.n_tests else 0
+
+    def category_pass_counts(self, model: str) -> List[int]:
+        if np is not None:
+            index = np.frombuffer(self.category_index, dtype=np.uint16)
+            return np.bincount(
+                index[self._array(model)], minlength=len(self.categories)
+            ).tolist()
+        bits = self._bits(model)
+        return [(bits & mask).bit_count() for mask in self._category_masks()]
+
+    def category_table(self, baseline: str, candidate: str) -> Dict[str, Dict]:
+        """Baseline/candidate pass rates and delta per category, in the
+        shape of ``ResultAggregator.table``."""
+        sizes = self.category_sizes()
+        b_counts = self.category_pass_counts(baseline)
+        c_counts = self.category_pass_counts(candidate)
+        table = {}
+        for category, size, b, c in zip(self.categories, sizes, b_counts, c_counts):
+            b_rate = b / size if size else 0
+            c_rate = c / size if size else 0
+            table[category] = {"baseline": b_rate, "candidate": c_rate, "delta": c_rate - b_rate}
+        return table
+
+    def group_counts(self, baseline: str, candidate: str) -> List[Tuple[int, int, int]]:
+        """``(regressions, ties, improvements)`` per category."""
+        if np is not None:
+            index = np.frombuffer(self.category_index, dtype=np.uint16)
+            b, c = self._array(baseline), self._array(candidate)
+            k = len(self.categories)
+            regressions = np.bincount(index[b & ~c], minlength=k)
+            improvements = np.bincount(index[c & ~b], minlength=k)
+            ties = np.array(self.category_sizes()) - regressions - improvements
+            return list(zip(regressions.tolist(), ties.tolist(), improvements.tolist()))
+        b, c = self._bits(baseline), self._bits(candidate)
+        regressed, improved = b & ~c, c & ~b
+        counts = []
+        for mask in self._category_masks():
+            regressions = (regressed & mask).bit_count()
+            improvements = (improved & mask).bit_count()
+            counts.append((regressions, mask.bit_count() - regressions - improvements, improvements))
+        return counts
+
+    def discordant(
+        self,
+        baseline: str,
+        candidate: str,
+        start: int = 0,
+        stop: Optional[int] = None
+    ) -> Tuple[int, int]:
+        """``(regressions, improvements)`` over tests ``start:stop`` (all by default)."""
+        if np is not None:
+            b, c = self._array(baseline, start, stop), self._array(candidate, start, stop)
+            return int(np.count_nonzero(b & ~c)), int(np.count_nonzero(c & ~b))
+        b, c = self._bits(baseline, start, stop), self._bits(candidate, start, stop)
+        return (b & ~c).bit_count(), (c & ~b).bit_count()
+
+    def close(self):
+        """Release shared memory (and unlink it, as its creator)."""
+        if self._shm is not None:
+            self.cells.release()
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
@@ -7,18 +7,139 @@ and discovers delayed policy erosion failures.
 
 Usage:
     python scripts/step1_run_stress_tests.py --rollouts 50
+    python scripts/step1_run_stress_tests.py --rollouts 1000000 --workers 8
+    python scripts/step1_run_stress_tests.py --rollouts 1000000 --stream \
+        --output artifacts/stress_failures.jsonl
+    python scripts/step1_run_stress_tests.py --rollouts 1000000 --checkpoint-every 10000
+    python scripts/step1_run_stress_tests.py --rollouts 1000000 --resume
+    python scripts/step1_run_stress_tests.py --rollouts 10000000 --backend numpy
+    python scripts/step1_run_stress_tests.py --rollouts 100000 --scheduler thompson
+    python scripts/step1_run_stress_tests.py --rollouts 1000000 --target-ci-width 0.01
+    python scripts/step1_run_stress_tests.py --rollouts 1000000 --metrics-file artifacts/step1_metrics.json
+
+    # Multi-node: run each shard on its own machine, then merge
+    python scripts/step1_run_stress_tests.py --rollouts 1000000 --shard-index 0 --shard-count 4 \
+        --output artifacts/shard0.json
+    python scripts/step1_run_stress_tests.py merge artifacts/shard*.json \
+        --output artifacts/stress_failures.json
 """
 
 import argparse
+import asyncio
 import json
-import random
+import os
+import sys
 import time
+from collections import Counter, deque
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from statistics import NormalDist
 from pathlib import Path
-from dataclasses import dataclass, asdict
-from typing import List, Dict, Optional
+from dataclasses import dataclass, asdict, field
+from typing import List, Dict, Iterable, Iterator, Optional, Tuple
 
+sys.path.insert(0, str(Path(__file__).parent))
 
-@dataclass
+from rng_streams import RNGStreams, derive_seed
+
+try:
+    import numpy as np
+except ImportError:  # optional: only needed for --backend numpy
+    np = None
+
+
+ATTACK_TYPES = ["policy_erosion", "intent_drift", "decomposition", "context_manipulation"]
+MAX_TURNS = 8
+
+# (failure probability, mean failure turn) per mode. Adaptive mode has
+# higher success rate for delayed failures.
+ROLLOUT_MODEL = {
+    "adaptive": (0.25, 5.5),
+    "static": (0.15, 3.5),
+}
+FAILURE_TURN_STDDEV = 1.5
+
+# Rollouts per NumPy draw. Each block has its own stream, so vectorized
+# results do not depend on sharding as long as shards split on blocks.
+VECTOR_BLOCK = 65_536
+
+# Shards per worker; more shards than workers keeps the pool busy when
+# shards finish unevenly.
+SHARDS_PER_WORKER = 4
+
+# Upper bound on rollouts per shard, which bounds the failures held in
+# memory at once when streaming.
+MAX_SHARD_ROLLOUTS = 10_000
+
+CHECKPOINT_EVERY = 10_000
+
+# Adaptive scheduling: rollouts per allocation round, and the share of
+# each round every attack type is guaranteed regardless of its yield.
+SCHEDULER_ROUND = 1_000
+MIN_EXPLORE_SHARE = 0.05
+
+# Early stopping: rollouts between checks of the confidence interval
+CI_CHECK_EVERY = 1_000
+
+# Seconds between progress lines / metrics file updates
+PROGRESS_INTERVAL = 5.0
+
+# Async backend: conversations in flight per process, and seconds to wait
+# for one model turn before abandoning the conversation
+ASYNC_CONCURRENCY = 256
+TURN_TIMEOUT = 30.0
+
+
+class TurnRefs(Sequence):
+    """Turn texts held as IDs into a process-wide intern table.
+
+    Trajectories repeat the same few turn strings across millions of
+    failures, so each distinct text is stored once and a failure holds a
+    tuple of IDs. Reads like a read-only list of strings; the strings are
+    only looked up when the sequence is read or serialized.
+    """
+    __slots__ = ("ids",)
+
+    _texts: List[str] = []
+    _index: Dict[str, int] = {}
+
+    def __init__(self, ids: Tuple[int, ...]):
+        self.ids = ids
+
+    @classmethod
+    def from_texts(cls, texts: Iterable[str]) -> "TurnRefs":
+        ids = []
+        for text in texts:
+            turn_id = cls._index.get(text)
+            if turn_id is None:
+                turn_id = cls._index[text] = len(cls._texts)
+                cls._texts.append(text)
+            ids.append(turn_id)
+        return cls(tuple(ids))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._texts[i] for i in self.ids[index]]
+        return self._texts[self.ids[index]]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, TurnRefs):
+            return self.ids == other.ids
+        return isinstance(other, (list, tuple)) and list(self) == list(other)
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    def __reduce__(self):
+        # IDs are only meaningful inside one process, so pickle the texts
+        return (TurnRefs.from_texts, (list(self),))
+
+
+@dataclass(slots=True)
 class Failure:
     """A discovered failure."""
     failure_id: str
@@ -26,8 +147,33 @@ class Failure:
     failure_turn: int
     attack_type: str
     harm_level: int
-    trajectory: List[str]
-    model_responses: List[str]
+    trajectory: Sequence[str]
+    model_responses: Sequence[str]
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Failure":
+        """Load a failure, interning its turn texts."""
+        return cls(
+            failure_id=data["failure_id"],
+            rollout_id=data["rollout_id"],
+            failure_turn=data["failure_turn"],
+            attack_type=data["attack_type"],
+            harm_level=data["harm_level"],
+            trajectory=TurnRefs.from_texts(data["trajectory"]),
+            model_responses=TurnRefs.from_texts(data["model_responses"])
+        )
+
+    def to_dict(self) -> Dict:
+        """Serializable form, with turn texts expanded."""
+        return {
+            "failure_id": self.failure_id,
+            "rollout_id": self.rollout_id,
+            "failure_turn": self.failure_turn,
+            "attack_type": self.attack_type,
+            "harm_level": self.harm_level,
+            "trajectory": list(self.trajectory),
+            "model_responses": list(self.model_responses)
+        }
 
 
 @dataclass
@@ -39,83 +185,1186 @@ class StressReport:
     by_turn: Dict[int, int]
     by_attack_type: Dict[str, int]
     avg_failure_turn: float
+    allocation: Optional[Dict] = None
+    precision: Optional[Dict] = None
+    shard: Optional[Dict] = None
+    driver: Optional[Dict] = None
+    # Failure records were not built (numpy backend without --failure-records)
+    aggregates_only: bool = False
 
     def save(self, path: str):
         """Save report to JSON."""
         output = {
             "total_rollouts": self.total_rollouts,
             "total_failures": self.total_failures,
-            "failures": [asdict(f) for f in self.failures],
+            "failures": [f.to_dict() for f in self.failures],
             "by_turn": self.by_turn,
             "by_attack_type": self.by_attack_type,
             "avg_failure_turn": self.avg_failure_turn
         }
+        output.update(self.sections())
         Path(path).parent.mkdir(parents=True, exist_ok=True)
         with open(path, 'w') as f:
             json.dump(output, f, indent=2)
 
+    def sections(self) -> Dict:
+        """Optional report blocks that were produced by this campaign."""
+        sections = {
+            "allocation": self.allocation,
+            "precision": self.precision,
+            "shard": self.shard,
+            "driver": self.driver
+        }
+        sections = {name: block for name, block in sections.items() if block is not None}
+        if self.aggregates_only:
+            sections["aggregates_only"] = True
+        return sections
 
-def run_redteam(mode: str, rollouts: int) -> StressReport:
-    """Run red-teaming and discover failures."""
-    print(f"Running {rollouts} {mode} rollouts...")
 
-    failures = []
-    by_turn = {}
-    by_attack_type = {}
+@dataclass
+class FailureAggregates:
+    """Running aggregates over failures, updated without keeping them.
+
+    ``rollouts_by_attack_type`` counts every rollout, failing or not, for
+    per-type rates; it is not part of the saved summary.
+    """
+    total_failures: int = 0
+    turn_sum: int = 0
+    by_turn: Dict[int, int] = field(default_factory=dict)
+    by_attack_type: Dict[str, int] = field(default_factory=dict)
+    rollouts_by_attack_type: Dict[str, int] = field(default_factory=dict)
+
+    def add_rollout(self, attack_type: str):
+        """Count one rollout."""
+        self.rollouts_by_attack_type[attack_type] = self.rollouts_by_attack_type.get(attack_type, 0) + 1
+
+    def add(self, failure: Failure):
+        """Count one failure."""
+        self.total_failures += 1
+        self.turn_sum += failure.failure_turn
+        self.by_turn[failure.failure_turn] = self.by_turn.get(failure.failure_turn, 0) + 1
+        self.by_attack_type[failure.attack_type] = self.by_attack_type.get(failure.attack_type, 0) + 1
 
-    attack_types = ["policy_erosion", "intent_drift", "decomposition", "context_manipulation"]
+    def merge(self, other: "FailureAggregates"):
+        """Fold in aggregates from a later range of rollouts."""
+        self.total_failures += other.total_failures
+        self.turn_sum += other.turn_sum
+        for turn, count in other.by_turn.items():
+            self.by_turn[turn] = self.by_turn.get(turn, 0) + count
+        for attack_type, count in other.by_attack_type.items():
+            self.by_attack_type[attack_type] = self.by_attack_type.get(attack_type, 0) + count
+        for attack_type, count in other.rollouts_by_attack_type.items():
+            self.rollouts_by_attack_type[attack_type] = self.rollouts_by_attack_type.get(attack_type, 0) + count
 
-    for i in range(rollouts):
-        # Simulate rollout
-        attack_type = random.choice(attack_types)
-        max_turns = 8
+    @classmethod
+    def from_dict(cls, data: Dict) -> "FailureAggregates":
+        """Rebuild aggregates saved with ``asdict`` (JSON turns keys into strings)."""
+        return cls(
+            total_failures=data["total_failures"],
+            turn_sum=data["turn_sum"],
+            by_turn={int(turn): count for turn, count in data["by_turn"].items()},
+            by_attack_type=dict(data["by_attack_type"]),
+            rollouts_by_attack_type=dict(data.get("rollouts_by_attack_type", {}))
+        )
 
-        # Adaptive mode has higher success rate for delayed failures
-        if mode == "adaptive":
-            failure_prob = 0.25
-            avg_turn = 5.5
+    @property
+    def avg_failure_turn(self) -> float:
+        return self.turn_sum / self.total_failures if self.total_failures else 0
+
+    def summary(self, total_rollouts: int) -> Dict:
+        """Summary fields shared by every output format."""
+        return {
+            "total_rollouts": total_rollouts,
+            "total_failures": self.total_failures,
+            "by_turn": self.by_turn,
+            "by_attack_type": self.by_attack_type,
+            "avg_failure_turn": self.avg_failure_turn
+        }
+
+
+@dataclass
+class ShardResult:
+    """Failures and aggregates for one contiguous range of rollouts."""
+    start: int
+    stop: int
+    failures: List[Failure]
+    aggregates: FailureAggregates
+
+
+class FailureSink:
+    """Receives failures in rollout order and builds the final report.
+
+    The default sink keeps every failure in memory; subclasses decide where
+    failures go. Failure IDs are assigned here, after shards are put back
+    in rollout order, so they do not depend on how rollouts were split.
+    """
+
+    def __init__(self):
+        self.aggregates = FailureAggregates()
+        self.failures: List[Failure] = []
+
+    def add_shard(self, shard: ShardResult):
+        """Accept the next shard in rollout order."""
+        first_id = self.aggregates.total_failures
+        for n, failure in enumerate(shard.failures):
+            failure.failure_id = f"fail_{first_id + n:04d}"
+            self.write(failure)
+        self.aggregates.merge(shard.aggregates)
+
+    def write(self, failure: Failure):
+        """Store one failure."""
+        self.failures.append(failure)
+
+    def restore(self, aggregates: FailureAggregates, failures: Iterable[Failure]):
+        """Reload the state of an interrupted campaign from a checkpoint."""
+        for failure in failures:
+            self.write(failure)
+        self.aggregates = aggregates
+
+    def close(self, total_rollouts: int, **sections) -> StressReport:
+        """Finish the campaign and return its report.
+
+        ``sections`` are optional report blocks (``allocation``,
+        ``precision``, ``shard``, ``driver``) and ``aggregates_only``.
+        """
+        return StressReport(
+            total_rollouts=total_rollouts,
+            total_failures=self.aggregates.total_failures,
+            failures=self.failures,
+            by_turn=self.aggregates.by_turn,
+            by_attack_type=self.aggregates.by_attack_type,
+            avg_failure_turn=self.aggregates.avg_failure_turn,
+            **sections
+        )
+
+
+class JsonlFailureSink(FailureSink):
+    """Streams failures to a JSONL file as they are found.
+
+    Each failure is one line, flushed immediately, so an interrupted
+    campaign keeps everything found so far. When the campaign finishes a
+    final ``{"summary": {...}}`` line is appended with the same aggregates
+    as ``stress_failures.json``. Memory use does not grow with rollouts.
+    """
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = path
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(path, 'w')
+
+    def write(self, failure: Failure):
+        self._file.write(json.dumps(failure.to_dict()) + "\n")
+        self._file.flush()
+
+    def close(self, total_rollouts: int, **sections) -> StressReport:
+        report = super().close(total_rollouts, **sections)
+        summary = self.aggregates.summary(total_rollouts)
+        summary.update(report.sections())
+        self._file.write(json.dumps({"summary": summary}) + "\n")
+        self._file.close()
+        return report
+
+
+class Checkpoint:
+    """Periodic checkpoints so an interrupted campaign can resume.
+
+    The checkpoint file records the next rollout to run, the RNG state and
+    the partial aggregates. Because every rollout has its own stream, the
+    RNG state is just the seed and the next rollout ID. Failures found so
+    far are appended to a ``<path>.failures.jsonl`` log; the checkpoint
+    stores its byte offset, so failures logged after the last checkpoint
+    are discarded on resume and their rollouts are run again.
+    """
+
+    def __init__(self, path: str, every: int = CHECKPOINT_EVERY):
+        self.path = Path(path)
+        self.log_path = Path(f"{path}.failures.jsonl")
+        self.every = every
+        self._log = None
+        self._last_rollout = 0
+
+    def load(self) -> Optional[Dict]:
+        """Return the saved checkpoint, or None if there is none."""
+        if not self.path.exists():
+            return None
+        with open(self.path) as f:
+            return json.load(f)
+
+    def read_failures(self, offset: int) -> Iterator[Failure]:
+        """Yield failures logged before ``offset``."""
+        with open(self.log_path, 'rb') as f:
+            while f.tell() < offset:
+                yield Failure.from_dict(json.loads(f.readline()))
+
+    def open_log(self, state: Optional[Dict]):
+        """Open the failure log, truncated to the checkpointed offset."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if state is None:
+            self._log = open(self.log_path, 'wb')
+            self._last_rollout = 0
         else:
-            failure_prob = 0.15
-            avg_turn = 3.5
-
-        if random.random() < failure_prob:
-            # Generate failure
-            failure_turn = max(1, min(max_turns, int(random.gauss(avg_turn, 1.5))))
-
-            failure = Failure(
-                failure_id=f"fail_{len(failures):04d}",
-                rollout_id=i,
-                failure_turn=failure_turn,
-                attack_type=attack_type,
-                harm_level=random.randint(2, 4),
-                trajectory=[f"Turn {t}: [redacted attack]" for t in range(1, failure_turn + 1)],
-                model_responses=[f"Turn {t}: [redacted response]" for t in range(1, failure_turn + 1)]
+            self._log = open(self.log_path, 'r+b')
+            self._log.truncate(state["failures_log_offset"])
+            self._log.seek(state["failures_log_offset"])
+            self._last_rollout = state["next_rollout"]
+
+    def log(self, failures: List[Failure]):
+        """Append failures from a completed shard to the log."""
+        for failure in failures:
+            self._log.write((json.dumps(failure.to_dict()) + "\n").encode())
+
+    def maybe_save(
+        self,
+        campaign: Dict,
+        next_rollout: int,
+        aggregates: FailureAggregates,
+        scheduler_state: Optional[Dict] = None
+    ):
+        """Write a checkpoint if ``every`` rollouts have run since the last one."""
+        if next_rollout - self._last_rollout < self.every:
+            return
+        self._log.flush()
+        os.fsync(self._log.fileno())
+        state = {
+            "campaign": campaign,
+            "next_rollout": next_rollout,
+            "rng": {"seed": campaign["seed"], "next_rollout_id": next_rollout},
+            "aggregates": asdict(aggregates),
+            "scheduler": scheduler_state,
+            "failures_log_offset": self._log.tell()
+        }
+        # Write-then-rename so a crash mid-write leaves the old checkpoint
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self.path)
+        self._last_rollout = next_rollout
+
+    def clear(self):
+        """Remove checkpoint files once the campaign has finished."""
+        self._log.close()
+        self.path.unlink(missing_ok=True)
+        self.log_path.unlink(missing_ok=True)
+
+
+class ThompsonScheduler:
+    """Adaptive allocation of rollouts across attack types.
+
+    Rollouts are allocated in rounds of ``round_size``. Every attack type
+    first gets ``min_share`` of the round so no type is starved; each
+    remaining rollout goes to the type with the highest draw from its
+    Beta(1 + failures, 1 + non-failures) posterior. A round's allocation
+    depends only on earlier rounds and its own seeded stream, so campaigns
+    stay reproducible for any worker count and can resume between rounds.
+    """
+
+    name = "thompson"
+
+    def __init__(
+        self,
+        seed: int,
+        attack_types: List[str] = ATTACK_TYPES,
+        min_share: float = MIN_EXPLORE_SHARE,
+        round_size: int = SCHEDULER_ROUND
+    ):
+        if min_share * len(attack_types) > 1:
+            raise ValueError(
+                f"min_share {min_share} x {len(attack_types)} attack types exceeds the round"
             )
+        self.seed = seed
+        self.attack_types = list(attack_types)
+        self.min_share = min_share
+        self.round_size = round_size
+        self.trials = {t: 0 for t in self.attack_types}
+        self.failures = {t: 0 for t in self.attack_types}
+
+    def config(self) -> Dict:
+        return {"scheduler": self.name, "min_share": self.min_share, "round_size": self.round_size}
+
+    def allocate(self, round_index: int, size: int) -> List[str]:
+        """Attack type for each rollout of a round, in rollout order."""
+        rng = RNGStreams(self.seed).stream("scheduler", round_index)
+        floor = min(int(self.min_share * size), size // len(self.attack_types))
+        counts = {t: floor for t in self.attack_types}
+
+        posteriors = [
+            (t, 1 + self.failures[t], 1 + self.trials[t] - self.failures[t])
+            for t in self.attack_types
+        ]
+        for _ in range(size - floor * len(self.attack_types)):
+            best = max(posteriors, key=lambda p: rng.betavariate(p[1], p[2]))[0]
+            counts[best] += 1
+
+        assignment = [t for t in self.attack_types for _ in range(counts[t])]
+        rng.shuffle(assignment)
+        return assignment
+
+    def update(self, assignment: List[str], aggregates: FailureAggregates):
+        """Record a finished round."""
+        for attack_type, count in Counter(assignment).items():
+            self.trials[attack_type] += count
+        for attack_type, count in aggregates.by_attack_type.items():
+            self.failures[attack_type] += count
+
+    def state(self) -> Dict:
+        return {"trials": dict(self.trials), "failures": dict(self.failures)}
+
+    def restore(self, state: Dict):
+        self.trials = dict(state["trials"])
+        self.failures = dict(state["failures"])
+
+    def summary(self) -> Dict:
+        """How the budget was allocated, for reweighting per-type rates.
+
+        ``reweighted_failure_rate`` is the mean of per-type failure rates,
+        i.e. the rate a uniform allocation would be expected to measure.
+        """
+        rates = {
+            t: self.failures[t] / self.trials[t] if self.trials[t] else 0.0
+            for t in self.attack_types
+        }
+        total = sum(self.trials.values())
+        return {
+            **self.config(),
+            "rollouts_by_attack_type": dict(self.trials),
+            "share_by_attack_type": {
+                t: self.trials[t] / total if total else 0.0 for t in self.attack_types
+            },
+            "failure_rate_by_attack_type": rates,
+            "reweighted_failure_rate": sum(rates.values()) / len(rates)
+        }
+
+
+def wilson_interval(failures: int, rollouts: int, confidence: float) -> Tuple[float, float]:
+    """Wilson score interval for a failure rate."""
+    if rollouts == 0:
+        return 0.0, 1.0
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    p = failures / rollouts
+    denom = 1 + z * z / rollouts
+    center = (p + z * z / (2 * rollouts)) / denom
+    half = z * (p * (1 - p) / rollouts + z * z / (4 * rollouts * rollouts)) ** 0.5 / denom
+    return max(0.0, center - half), min(1.0, center + half)
+
+
+@dataclass
+class PrecisionTarget:
+    """Stop a campaign once the failure-rate interval is narrow enough.
+
+    The interval is checked every ``check_every`` rollouts (every vector
+    block with the numpy backend), always at the same rollout counts, so
+    the stopping point does not depend on worker count. With
+    ``per_attack_type`` every attack type's interval must also meet the
+    width.
+    """
+    width: float
+    confidence: float = 0.95
+    per_attack_type: bool = False
+    check_every: int = CI_CHECK_EVERY
+
+    def config(self) -> Dict:
+        return {
+            "target_width": self.width,
+            "confidence": self.confidence,
+            "per_attack_type": self.per_attack_type
+        }
+
+    def intervals(self, aggregates: FailureAggregates, rollouts: int) -> Dict:
+        """Overall and per-attack-type intervals."""
+        by_type = {
+            t: wilson_interval(aggregates.by_attack_type.get(t, 0), n, self.confidence)
+            for t, n in aggregates.rollouts_by_attack_type.items()
+        }
+        return {
+            "overall": wilson_interval(aggregates.total_failures, rollouts, self.confidence),
+            "by_attack_type": by_type
+        }
+
+    def is_met(self, aggregates: FailureAggregates, rollouts: int) -> bool:
+        intervals = self.intervals(aggregates, rollouts)
+        checked = [intervals["overall"]]
+        if self.per_attack_type:
+            if len(intervals["by_attack_type"]) < len(ATTACK_TYPES):
+                return False
+            checked.extend(intervals["by_attack_type"].values())
+        return all(hi - lo < self.width for lo, hi in checked)
+
+    def summary(self, aggregates: FailureAggregates, rollouts: int, max_rollouts: int) -> Dict:
+        intervals = self.intervals(aggregates, rollouts)
+        lo, hi = intervals["overall"]
+        return {
+            **self.config(),
+            "met": self.is_met(aggregates, rollouts),
+            "rollouts_used": rollouts,
+            "max_rollouts": max_rollouts,
+            "interval": [lo, hi],
+            "width": hi - lo,
+            "by_attack_type": {t: list(ci) for t, ci in intervals["by_attack_type"].items()}
+        }
+
+
+class ProgressMonitor:
+    """Rate-limited progress and throughput metrics for a campaign.
+
+    Called once per shard, never per rollout, and only formats output when
+    ``interval`` seconds have passed, so it stays out of the hot loop.
+    Each emit prints rollouts/s, failures/s, ETA and per-attack-type yield,
+    and, with ``metrics_path``, atomically replaces a JSON metrics file
+    that schedulers can scrape. Rates cover this process only, so they
+    stay meaningful after a resume.
+    """
+
+    def __init__(
+        self,
+        total_rollouts: int,
+        interval: float = PROGRESS_INTERVAL,
+        metrics_path: Optional[str] = None,
+        clock=time.monotonic
+    ):
+        self.total_rollouts = total_rollouts
+        self.interval = interval
+        self.metrics_path = Path(metrics_path) if metrics_path else None
+        self.clock = clock
+        self._start_time = None
+        self._last_emit = None
+        self._start_rollout = 0
+        self._start_failures = 0
+
+    def start(self, completed: int, aggregates: FailureAggregates):
+        """Mark where this process starts (non-zero after a resume)."""
+        self._start_time = self._last_emit = self.clock()
+        self._start_rollout = completed
+        self._start_failures = aggregates.total_failures
+
+    def update(self, completed: int, aggregates: FailureAggregates):
+        """Record progress; emits at most once per ``interval``."""
+        now = self.clock()
+        if now - self._last_emit >= self.interval:
+            self.emit(completed, aggregates, now)
+
+    def finish(self, completed: int, aggregates: FailureAggregates):
+        """Emit final metrics regardless of the interval."""
+        self.emit(completed, aggregates, self.clock(), done=True)
+
+    def snapshot(self, completed: int, aggregates: FailureAggregates, now: float, done: bool = False) -> Dict:
+        elapsed = max(now - self._start_time, 1e-9)
+        rollouts_per_sec = (completed - self._start_rollout) / elapsed
+        remaining = self.total_rollouts - completed
+        return {
+            "done": done,
+            "elapsed_seconds": elapsed,
+            "rollouts_completed": completed,
+            "rollouts_total": self.total_rollouts,
+            "failures": aggregates.total_failures,
+            "rollouts_per_sec": rollouts_per_sec,
+            "failures_per_sec": (aggregates.total_failures - self._start_failures) / elapsed,
+            "eta_seconds": 0.0 if done else (remaining / rollouts_per_sec if rollouts_per_sec else None),
+            "yield_by_attack_type": {
+                t: aggregates.by_attack_type.get(t, 0) / n
+                for t, n in aggregates.rollouts_by_attack_type.items() if n
+            }
+        }
+
+    def emit(self, completed: int, aggregates: FailureAggregates, now: float, done: bool = False):
+        self._last_emit = now
+        metrics = self.snapshot(completed, aggregates, now, done)
+
+        eta = metrics["eta_seconds"]
+        eta_text = "--" if eta is None else time.strftime("%H:%M:%S", time.gmtime(eta))
+        print(
+            f"  {completed}/{self.total_rollouts} rollouts "
+            f"| {metrics['rollouts_per_sec']:,.0f} rollouts/s "
+            f"| {metrics['failures_per_sec']:,.1f} failures/s "
+            f"| ETA {eta_text}"
+        )
+        if metrics["yield_by_attack_type"]:
+            print("    yield: " + ", ".join(
+                f"{t} {y:.1%}" for t, y in metrics["yield_by_attack_type"].items()
+            ))
+
+        if self.metrics_path is not None:
+            self.metrics_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.metrics_path.with_name(self.metrics_path.name + ".tmp")
+            with open(tmp_path, 'w') as f:
+                json.dump(metrics, f, indent=2)
+            os.replace(tmp_path, self.metrics_path)
+
+
+@lru_cache(maxsize=None)
+def redacted_turns(kind: str, failure_turn: int) -> TurnRefs:
+    """Shared turn list for a simulated trajectory of ``failure_turn`` turns."""
+    return TurnRefs.from_texts(f"Turn {t}: [redacted {kind}]" for t in range(1, failure_turn + 1))
+
+
+def make_failure(rollout_id: int, failure_turn: int, attack_type: str, harm_level: int) -> Failure:
+    """Build a full failure record.
+
+    ``failure_id`` is assigned by the sink once failures are back in
+    rollout order.
+    """
+    return Failure(
+        failure_id="",
+        rollout_id=rollout_id,
+        failure_turn=failure_turn,
+        attack_type=attack_type,
+        harm_level=harm_level,
+        trajectory=redacted_turns("attack", failure_turn),
+        model_responses=redacted_turns("response", failure_turn)
+    )
+
+
+def simulate_rollout(
+    mode: str,
+    rollout_id: int,
+    seed: int,
+    attack_type: Optional[str] = None
+) -> Optional[Failure]:
+    """Simulate one rollout, returning its failure if one was found.
+
+    The rollout draws only from its own stream, so it can be re-run on its
+    own and gives the same result as inside a full campaign. A scheduler
+    may fix ``attack_type``; the uniform draw is still taken so the rest of
+    the stream is unchanged.
+    """
+    return _run_rollout(mode, rollout_id, seed, attack_type)[1]
+
+
+def _run_rollout(
+    mode: str,
+    rollout_id: int,
+    seed: int,
+    attack_type: Optional[str] = None
+) -> Tuple[str, Optional[Failure]]:
+    """``simulate_rollout`` that also returns the attack type used."""
+    rng = RNGStreams(seed).rollout(rollout_id)
+    drawn_type = rng.choice(ATTACK_TYPES)
+    attack_type = attack_type or drawn_type
+    failure_prob, avg_turn = ROLLOUT_MODEL[mode]
+
+    if rng.random() >= failure_prob:
+        return attack_type, None
+
+    failure_turn = max(1, min(MAX_TURNS, int(rng.gauss(avg_turn, FAILURE_TURN_STDDEV))))
+    return attack_type, make_failure(rollout_id, failure_turn, attack_type, rng.randint(2, 4))
+
+
+def run_shard(
+    mode: str,
+    start: int,
+    stop: int,
+    seed: int,
+    attack_types: Optional[List[str]] = None
+) -> ShardResult:
+    """Run rollouts ``start`` (inclusive) to ``stop`` (exclusive).
+
+    ``attack_types`` optionally fixes the attack type of each rollout.
+    """
+    failures = []
+    aggregates = FailureAggregates()
+
+    for i in range(start, stop):
+        attack_type, failure = _run_rollout(
+            mode, i, seed, attack_types[i - start] if attack_types else None
+        )
+        aggregates.add_rollout(attack_type)
+        if failure is not None:
             failures.append(failure)
+            aggregates.add(failure)
+
+    return ShardResult(start=start, stop=stop, failures=failures, aggregates=aggregates)
+
+
+def run_shard_vectorized(
+    mode: str,
+    start: int,
+    stop: int,
+    seed: int,
+    failure_records: bool = False
+) -> ShardResult:
+    """Vectorized ``run_shard`` for a range inside one ``VECTOR_BLOCK``.
+
+    Draws the same rollout model as ``simulate_rollout`` as whole arrays
+    and builds the aggregates with ``bincount``. The block is always drawn
+    in full and then sliced, so a rollout's outcome does not depend on
+    where the range starts or stops. Failure records are only built when
+    ``failure_records`` is set. Results are reproducible for a seed but do
+    not match the Python backend rollout-for-rollout.
+    """
+    if np is None:
+        raise ImportError("The numpy backend requires numpy (pip install numpy)")
+
+    block, offset = divmod(start, VECTOR_BLOCK)
+    if stop > (block + 1) * VECTOR_BLOCK:
+        raise ValueError(f"Range [{start}, {stop}) crosses a vector block boundary")
+
+    rng = np.random.default_rng(derive_seed(seed, "block", block))
+    window = slice(offset, offset + stop - start)
+    failure_prob, avg_turn = ROLLOUT_MODEL[mode]
+
+    attack_idx = rng.integers(0, len(ATTACK_TYPES), VECTOR_BLOCK)[window]
+    failed = rng.random(VECTOR_BLOCK)[window] < failure_prob
+    gauss = rng.normal(avg_turn, FAILURE_TURN_STDDEV, VECTOR_BLOCK)[window]
+    harm = rng.integers(2, 5, VECTOR_BLOCK)[window]
+
+    # int() truncates toward zero before clamping, as in simulate_rollout
+    fail_idx = np.flatnonzero(failed)
+    fail_turns = np.clip(np.trunc(gauss[fail_idx]), 1, MAX_TURNS).astype(np.int64)
+    fail_attacks = attack_idx[fail_idx]
+
+    turn_counts = np.bincount(fail_turns, minlength=MAX_TURNS + 1)
+    attack_counts = np.bincount(fail_attacks, minlength=len(ATTACK_TYPES))
+    rollout_counts = np.bincount(attack_idx, minlength=len(ATTACK_TYPES))
+    aggregates = FailureAggregates(
+        total_failures=int(fail_idx.size),
+        turn_sum=int(fail_turns.sum()),
+        by_turn={turn: int(count) for turn, count in enumerate(turn_counts) if count},
+        by_attack_type={
+            ATTACK_TYPES[k]: int(count) for k, count in enumerate(attack_counts) if count
+        },
+        rollouts_by_attack_type={
+            ATTACK_TYPES[k]: int(count) for k, count in enumerate(rollout_counts) if count
+        }
+    )
 
-            by_turn[failure_turn] = by_turn.get(failure_turn, 0) + 1
-            by_attack_type[attack_type] = by_attack_type.get(attack_type, 0) + 1
+    failures = []
+    if failure_records:
+        for i, turn, attack in zip(fail_idx.tolist(), fail_turns.tolist(), fail_attacks.tolist()):
+            failures.append(make_failure(start + i, turn, ATTACK_TYPES[attack], int(harm[i])))
+
+    return ShardResult(start=start, stop=stop, failures=failures, aggregates=aggregates)
+
+
+def shard_ranges(rollouts: int, num_shards: int, start: int = 0) -> List[Tuple[int, int]]:
+    """Split ``range(start, rollouts)`` into contiguous, near-equal ranges."""
+    num_shards = max(1, min(num_shards, rollouts - start))
+    size, extra = divmod(rollouts - start, num_shards)
+    ranges = []
+    for k in range(num_shards):
+        stop = start + size + (1 if k < extra else 0)
+        ranges.append((start, stop))
+        start = stop
+    return ranges
+
+
+def block_ranges(rollouts: int, start: int = 0, block: int = VECTOR_BLOCK) -> List[Tuple[int, int]]:
+    """Split ``range(start, rollouts)`` on multiples of ``block``."""
+    ranges = []
+    while start < rollouts:
+        stop = min(rollouts, (start // block + 1) * block)
+        ranges.append((start, stop))
+        start = stop
+    return ranges or [(start, start)]
+
+
+def iter_shards(
+    mode: str,
+    rollouts: int,
+    seed: int,
+    workers: int,
+    start: int = 0,
+    backend: str = "python",
+    failure_records: bool = False,
+    chunk: Optional[int] = None
+) -> Iterator[ShardResult]:
+    """Yield shard results for rollouts ``start`` onwards, in rollout order.
+
+    In parallel mode at most ``2 * workers`` shards are in flight, so
+    finished-but-unconsumed shards cannot pile up in memory. ``chunk``
+    fixes Python-backend shards to multiples of ``chunk`` rollouts so
+    callers can act at the same rollout counts for any worker count.
+    """
+    if backend == "numpy":
+        ranges = block_ranges(rollouts, start)
+        shard_fn, shard_args = run_shard_vectorized, (seed, failure_records)
+    elif chunk is not None:
+        ranges = block_ranges(rollouts, start, chunk)
+        shard_fn, shard_args = run_shard, (seed,)
+    else:
+        num_shards = -(-(rollouts - start) // MAX_SHARD_ROLLOUTS)
+        if workers > 1:
+            num_shards = max(num_shards, workers * SHARDS_PER_WORKER)
+        ranges = shard_ranges(rollouts, num_shards, start)
+        shard_fn, shard_args = run_shard, (seed,)
+
+    if workers <= 1:
+        for shard_start, shard_stop in ranges:
+            shard = shard_fn(mode, shard_start, shard_stop, *shard_args)
+            yield shard
+        return
+
+    ranges = iter(ranges)
+    pool = ProcessPoolExecutor(max_workers=workers)
+    try:
+        pending = deque()
+        for shard_start, shard_stop in ranges:
+            pending.append(pool.submit(shard_fn, mode, shard_start, shard_stop, *shard_args))
+            if len(pending) >= 2 * workers:
+                break
+        while pending:
+            shard = pending.popleft().result()
+            next_range = next(ranges, None)
+            if next_range is not None:
+                pending.append(pool.submit(shard_fn, mode, *next_range, *shard_args))
+            yield shard
+    finally:
+        # Don't run queued shards if the caller stopped early
+        pool.shutdown(cancel_futures=True)
+
+
+def iter_scheduled_shards(
+    mode: str,
+    rollouts: int,
+    seed: int,
+    workers: int,
+    scheduler: ThompsonScheduler,
+    start: int = 0
+) -> Iterator[ShardResult]:
+    """Yield one merged shard per scheduler round, in rollout order.
+
+    Each round's rollouts are split across workers, merged, and fed back
+    to the scheduler before the next round is allocated.
+    """
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        for round_start in range(start, rollouts, scheduler.round_size):
+            round_stop = min(rollouts, round_start + scheduler.round_size)
+            assignment = scheduler.allocate(
+                round_start // scheduler.round_size, round_stop - round_start
+            )
+
+            if pool is None:
+                parts = [run_shard(mode, round_start, round_stop, seed, assignment)]
+            else:
+                futures = [
+                    pool.submit(
+                        run_shard, mode, a, b, seed,
+                        assignment[a - round_start:b - round_start]
+                    )
+                    for a, b in shard_ranges(round_stop, workers, round_start)
+                ]
+                parts = [future.result() for future in futures]
+
+            shard = ShardResult(round_start, round_stop, [], FailureAggregates())
+            for part in parts:
+                shard.failures.extend(part.failures)
+                shard.aggregates.merge(part.aggregates)
+
+            scheduler.update(assignment, shard.aggregates)
+            yield shard
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+
+class AsyncRolloutDriver:
+    """Runs rollouts as live multi-turn conversations with a model client.
+
+    Model calls are I/O-bound, so rather than one conversation per process
+    up to ``concurrency`` conversations are kept in flight on one event
+    loop, bounded by a semaphore. Each turn waits at most ``turn_timeout``
+    seconds; a conversation that times out, loses its connection or gets a
+    malformed reply ends without a failure and is counted in ``summary()``.
+
+    Attack types and rollout IDs come from the same per-rollout streams as
+    the simulator, and results are collected in rollout order, so against
+    ``StubModelClient`` the report matches ``--backend python``.
+    """
+
+    def __init__(
+        self,
+        client,
+        concurrency: int = ASYNC_CONCURRENCY,
+        turn_timeout: float = TURN_TIMEOUT
+    ):
+        self.client = client
+        self.concurrency = concurrency
+        self.turn_timeout = turn_timeout
+        self.turns = 0
+        self.timeouts = 0
+        self.errors = 0
+        self.malformed = 0
+
+    async def run_conversation(
+        self,
+        semaphore: asyncio.Semaphore,
+        rollout_id: int,
+        attack_type: str
+    ) -> Optional[Failure]:
+        """Attack for up to ``MAX_TURNS`` turns; return the failure if one occurs."""
+        messages = []
+        async with semaphore:
+            for turn in range(1, MAX_TURNS + 1):
+                messages.append({"role": "user", "content": f"Turn {turn}: [redacted attack]"})
+                try:
+                    reply = await asyncio.wait_for(
+                        self.client.respond(rollout_id, messages), self.turn_timeout
+                    )
+                except asyncio.TimeoutError:
+                    self.timeouts += 1
+                    return None
+                except (OSError, EOFError):
+                    self.errors += 1
+                    return None
+                except ValueError:
+                    # Includes JSON decode errors: the endpoint answered, but not validly
+                    self.malformed += 1
+                    return None
+                self.turns += 1
+                messages.append({"role": "assistant", "content": reply.text})
+
+                if reply.harm_level is not None:
+                    return Failure(
+                        failure_id="",
+                        rollout_id=rollout_id,
+                        failure_turn=turn,
+                        attack_type=attack_type,
+                        harm_level=reply.harm_level,
+                        trajectory=TurnRefs.from_texts(m["content"] for m in messages[::2]),
+                        model_responses=TurnRefs.from_texts(m["content"] for m in messages[1::2])
+                    )
+        return None
+
+    async def run_shard(self, start: int, stop: int, seed: int) -> ShardResult:
+        """Async ``run_shard``: all rollouts in the range, at most ``concurrency`` at once."""
+        semaphore = asyncio.Semaphore(self.concurrency)
+        streams = RNGStreams(seed)
+        attack_types = [streams.rollout(i).choice(ATTACK_TYPES) for i in range(start, stop)]
+        outcomes = await asyncio.gather(*(
+            self.run_conversation(semaphore, i, attack_type)
+            for i, attack_type in zip(range(start, stop), attack_types)
+        ))
+
+        failures = []
+        aggregates = FailureAggregates()
+        for attack_type, failure in zip(attack_types, outcomes):
+            aggregates.add_rollout(attack_type)
+            if failure is not None:
+                failures.append(failure)
+                aggregates.add(failure)
+        return ShardResult(start, stop, failures, aggregates)
+
+    def iter_shards(
+        self,
+        rollouts: int,
+        seed: int,
+        start: int = 0,
+        chunk: Optional[int] = None
+    ) -> Iterator[ShardResult]:
+        """Yield shard results for rollouts ``start`` to ``rollouts``, in rollout order."""
+        loop = asyncio.new_event_loop()
+        try:
+            for shard_start, shard_stop in block_ranges(rollouts, start, chunk or MAX_SHARD_ROLLOUTS):
+                yield loop.run_until_complete(self.run_shard(shard_start, shard_stop, seed))
+        finally:
+            loop.run_until_complete(self.client.close())
+            loop.close()
+
+    def summary(self) -> Dict:
+        return {
+            "client": self.client.name,
+            "concurrency": self.concurrency,
+            "turn_timeout": self.turn_timeout,
+            "turns": self.turns,
+            "timeouts": self.timeouts,
+            "errors": self.errors,
+            "malformed": self.malformed
+        }
+
+
+def run_redteam(
+    mode: str,
+    rollouts: int,
+    seed: int = 42,
+    workers: int = 1,
+    sink: Optional[FailureSink] = None,
+    checkpoint: Optional[Checkpoint] = None,
+    resume: bool = False,
+    backend: str = "python",
+    failure_records: bool = False,
+    scheduler: Optional[ThompsonScheduler] = None,
+    precision: Optional[PrecisionTarget] = None,
+    progress: Optional[ProgressMonitor] = None,
+    first_rollout: int = 0,
+    shard: Optional[Dict] = None,
+    driver: Optional[AsyncRolloutDriver] = None
+) -> StressReport:
+    """Run red-teaming and discover failures.
+
+    With ``workers > 1`` rollouts are sharded across a process pool. Each
+    rollout draws from its own seeded generator, so the report is identical
+    for any worker count. Pass a ``JsonlFailureSink`` to stream failures to
+    disk instead of keeping them in memory, and a ``Checkpoint`` to save
+    progress periodically; with ``resume`` the campaign continues from the
+    last checkpoint and produces the same report as an uninterrupted run.
+
+    ``backend="numpy"`` draws rollouts in vectorized blocks and only builds
+    ``Failure`` records if ``failure_records`` is set; otherwise the report
+    carries aggregates only and is marked ``aggregates_only``, which step 2
+    refuses.
+
+    A ``scheduler`` replaces the uniform attack-type draw with adaptive
+    allocation; the report's ``allocation`` records how the budget was
+    spent. Schedulers run on the Python backend only.
+
+    With a ``precision`` target, ``rollouts`` is a maximum budget: the
+    campaign stops as soon as the failure-rate interval is narrower than
+    the target, and the report's ``precision`` block gives the interval and
+    the rollouts it took.
 
-        # Progress indicator
-        if (i + 1) % 10 == 0:
-            print(f"  Completed {i + 1}/{rollouts} rollouts...")
+    Progress is reported by ``progress`` (a default ``ProgressMonitor`` if
+    not given) after each shard.
 
-    avg_failure_turn = (
-        sum(f.failure_turn for f in failures) / len(failures)
-        if failures else 0
+    Rollout IDs run from ``first_rollout`` to ``first_rollout + rollouts``,
+    so one campaign can be split into shards on separate machines and
+    recombined with ``merge_reports``. ``shard`` describes the slice and is
+    saved with the report.
+
+    ``backend="async"`` runs each rollout as a conversation with a live
+    model through ``driver``; the report's ``driver`` block counts turns,
+    timeouts and connection errors.
+    """
+    if scheduler is not None and backend != "python":
+        raise ValueError("Adaptive scheduling requires the python backend")
+    if (backend == "async") != (driver is not None):
+        raise ValueError("The async backend needs a driver, and only it uses one")
+    if driver is not None and workers > 1:
+        raise ValueError("The async backend runs in one process; raise the driver's concurrency instead")
+
+    sink = sink if sink is not None else FailureSink()
+    stop = first_rollout + rollouts
+    campaign = {
+        "mode": mode,
+        "rollouts": rollouts,
+        "seed": seed,
+        "backend": backend,
+        "first_rollout": first_rollout
+    }
+    if scheduler is not None:
+        campaign.update(scheduler.config())
+    if precision is not None:
+        campaign.update(precision.config())
+    start = first_rollout
+
+    if checkpoint is not None:
+        state = checkpoint.load() if resume else None
+        if state is not None:
+            if state["campaign"] != campaign:
+                raise ValueError(
+                    f"Checkpoint {checkpoint.path} is for campaign {state['campaign']}, "
+                    f"not {campaign}"
+                )
+            if not checkpoint.log_path.exists():
+                raise ValueError(
+                    f"Checkpoint {checkpoint.path} has no failure log at {checkpoint.log_path}"
+                )
+            start = state["next_rollout"]
+            if scheduler is not None:
+                scheduler.restore(state["scheduler"])
+            sink.restore(
+                FailureAggregates.from_dict(state["aggregates"]),
+                checkpoint.read_failures(state["failures_log_offset"])
+            )
+            print(f"Resuming from rollout {start} ({sink.aggregates.total_failures} failures so far)")
+        checkpoint.open_log(state)
+
+    print(f"Running {stop - start} {mode} rollouts...")
+    if workers > 1:
+        print(f"  Sharding across {workers} workers...")
+
+    chunk = precision.check_every if precision is not None else None
+    if scheduler is not None:
+        shards = iter_scheduled_shards(mode, stop, seed, workers, scheduler, start)
+    elif driver is not None:
+        shards = driver.iter_shards(stop, seed, start, chunk)
+    else:
+        shards = iter_shards(
+            mode, stop, seed, workers, start, backend, failure_records, chunk
+        )
+
+    progress = progress if progress is not None else ProgressMonitor(rollouts)
+    progress.start(start - first_rollout, sink.aggregates)
+
+    # Rollouts completed in this campaign (not rollout IDs)
+    completed = start - first_rollout
+    for result in shards:
+        sink.add_shard(result)
+        completed = result.stop - first_rollout
+        progress.update(completed, sink.aggregates)
+        if checkpoint is not None:
+            checkpoint.log(result.failures)
+            checkpoint.maybe_save(
+                campaign, result.stop, sink.aggregates,
+                scheduler.state() if scheduler is not None else None
+            )
+        if precision is not None and precision.is_met(sink.aggregates, completed):
+            print(f"  Target interval width reached after {completed} rollouts")
+            break
+    shards.close()
+    progress.finish(completed, sink.aggregates)
+
+    report = sink.close(
+        completed,
+        allocation=scheduler.summary() if scheduler is not None else None,
+        precision=(
+            precision.summary(sink.aggregates, completed, rollouts)
+            if precision is not None else None
+        ),
+        shard=shard,
+        driver=driver.summary() if driver is not None else None,
+        aggregates_only=backend == "numpy" and not failure_records
     )
+    if checkpoint is not None:
+        checkpoint.clear()
+    return report
+
+
+def read_report_summary(path: str) -> Dict:
+    """Summary fields of a saved report (JSON or streamed JSONL)."""
+    if path.endswith(".jsonl"):
+        summary = None
+        with open(path) as f:
+            for line in f:
+                if line.startswith('{"summary"'):
+                    summary = json.loads(line)["summary"]
+        if summary is None:
+            raise ValueError(f"{path} has no summary line; the campaign did not finish")
+        return summary
+
+    with open(path) as f:
+        data = json.load(f)
+    data.pop("failures", None)
+    return data
+
+
+def iter_report_failures(path: str) -> Iterator[Failure]:
+    """Failure records of a saved report, in file order."""
+    if path.endswith(".jsonl"):
+        with open(path) as f:
+            for line in f:
+                record = json.loads(line)
+                if "summary" not in record:
+                    yield Failure.from_dict(record)
+        return
+
+    with open(path) as f:
+        data = json.load(f)
+    for record in data.get("failures", []):
+        yield Failure.from_dict(record)
+
+
+def merge_reports(paths: List[str], sink: Optional[FailureSink] = None) -> StressReport:
+    """Combine shard reports from ``--shard-index``/``--shard-count`` runs.
 
-    return StressReport(
-        total_rollouts=rollouts,
-        total_failures=len(failures),
-        failures=failures,
-        by_turn=by_turn,
-        by_attack_type=by_attack_type,
-        avg_failure_turn=avg_failure_turn
+    Shards are ordered by rollout ID and must cover the campaign without
+    gaps or overlap. Failure IDs are renumbered in rollout order and the
+    aggregates are recomputed from the failure records (or summed from the
+    shard summaries when a shard saved aggregates only), so the merged
+    report matches a single-node run with the same seed. Only one shard's
+    failures are held in memory at a time.
+    """
+    summaries = []
+    for path in paths:
+        summary = read_report_summary(path)
+        if "shard" not in summary:
+            raise ValueError(f"{path} is not a shard report (no shard block)")
+        summaries.append((summary, path))
+    summaries.sort(key=lambda item: item[0]["shard"]["first_rollout"])
+
+    first = summaries[0][0]["shard"]
+    campaign_keys = ("mode", "seed", "backend", "shard_count", "rollout_offset", "campaign_rollouts")
+    for summary, path in summaries:
+        info = summary["shard"]
+        for key in campaign_keys:
+            if info[key] != first[key]:
+                raise ValueError(f"{path} has {key}={info[key]!r}, expected {first[key]!r}")
+
+    indices = sorted(summary["shard"]["index"] for summary, _ in summaries)
+    if indices != list(range(first["shard_count"])):
+        raise ValueError(f"Expected shards 0..{first['shard_count'] - 1}, got {indices}")
+
+    next_rollout = first["first_rollout"]
+    for summary, path in summaries:
+        info = summary["shard"]
+        if info["first_rollout"] != next_rollout:
+            raise ValueError(
+                f"{path} starts at rollout {info['first_rollout']}, expected {next_rollout}"
+            )
+        next_rollout = info["first_rollout"] + summary["total_rollouts"]
+
+    sink = sink if sink is not None else FailureSink()
+    total_rollouts = 0
+    aggregates_only = False
+    for summary, path in summaries:
+        failures = list(iter_report_failures(path))
+        aggregates = FailureAggregates()
+        if len(failures) == summary["total_failures"]:
+            for failure in failures:
+                aggregates.add(failure)
+        else:
+            # Aggregates-only shard (numpy backend without --failure-records)
+            aggregates_only = True
+            aggregates = FailureAggregates(
+                total_failures=summary["total_failures"],
+                turn_sum=round(summary["avg_failure_turn"] * summary["total_failures"]),
+                by_turn={int(turn): count for turn, count in summary["by_turn"].items()},
+                by_attack_type=dict(summary["by_attack_type"])
+            )
+        start = summary["shard"]["first_rollout"]
+        sink.add_shard(ShardResult(start, start + summary["total_rollouts"], failures, aggregates))
+        total_rollouts += summary["total_rollouts"]
+
+    return sink.close(total_rollouts, aggregates_only=aggregates_only)
+
+
+def merge_main(argv: List[str]):
+    """``merge`` subcommand: combine shard reports into one."""
+    parser = argparse.ArgumentParser(
+        prog="step1_run_stress_tests.py merge",
+        description="Merge shard stress test reports into one report"
+    )
+    parser.add_argument("inputs", nargs="+", help="Shard report files (.json or .jsonl)")
+    parser.add_argument(
+        "--output",
+        default="artifacts/stress_failures.json",
+        help="Output file path"
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Write the merged report as JSONL"
     )
+    args = parser.parse_args(argv)
+
+    print("=" * 60)
+    print("STEP 1: MERGE SHARD REPORTS")
+    print("=" * 60)
+    print(f"Shards: {len(args.inputs)}")
+
+    sink = JsonlFailureSink(args.output) if args.stream else None
+    try:
+        report = merge_reports(args.inputs, sink)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return
+
+    print(f"Total rollouts: {report.total_rollouts}")
+    print(f"Discovered failures: {report.total_failures}")
+    print(f"Avg failure turn: {report.avg_failure_turn:.1f}")
+
+    if not args.stream:
+        report.save(args.output)
+    print(f"\nSaved to {args.output}")
+    if report.aggregates_only:
+        print("Aggregates only: step 2 cannot generate tests from this report "
+              "(re-run the shards with --failure-records)")
 
 
 def main():
+    if sys.argv[1:2] == ["merge"]:
+        merge_main(sys.argv[2:])
+        return
+
     parser = argparse.ArgumentParser(
         description="Run stress tests to discover delayed failures"
     )
@@ -142,19 +1391,238 @@ def main():
         default=42,
         help="Random seed"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for rollouts (output is identical for any value)"
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Stream failures to --output as JSONL instead of holding them in memory"
+    )
+    parser.add_argument(
+        "--checkpoint",
+        default=None,
+        help="Checkpoint file path (default: <output>.ckpt)"
+    )
+    parser.add_argument(
+        "--checkpoint-every",
+        type=int,
+        default=None,
+        help=f"Rollouts between checkpoints (default: {CHECKPOINT_EVERY})"
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted campaign from its last checkpoint"
+    )
+    parser.add_argument(
+        "--backend",
+        choices=["python", "numpy", "async"],
+        default="python",
+        help="Rollout simulator (numpy draws whole batches; requires numpy), "
+             "or async conversations with --endpoint"
+    )
+    parser.add_argument(
+        "--failure-records",
+        action="store_true",
+        help="With --backend numpy, also build full failure records (required by step 2; "
+             "default: aggregates only)"
+    )
+    parser.add_argument(
+        "--scheduler",
+        choices=["uniform", "thompson"],
+        default="uniform",
+        help="Attack-type allocation (thompson shifts budget toward high-yield types)"
+    )
+    parser.add_argument(
+        "--min-explore",
+        type=float,
+        default=MIN_EXPLORE_SHARE,
+        help="Minimum share of each scheduler round per attack type"
+    )
+    parser.add_argument(
+        "--target-ci-width",
+        type=float,
+        default=None,
+        help="Stop once the failure-rate confidence interval is narrower than this "
+             "(--rollouts becomes the maximum budget)"
+    )
+    parser.add_argument(
+        "--ci-confidence",
+        type=float,
+        default=0.95,
+        help="Confidence level for --target-ci-width"
+    )
+    parser.add_argument(
+        "--ci-per-attack-type",
+        action="store_true",
+        help="With --target-ci-width, require every attack type's interval to meet it too"
+    )
+    parser.add_argument(
+        "--progress-interval",
+        type=float,
+        default=PROGRESS_INTERVAL,
+        help="Seconds between progress updates"
+    )
+    parser.add_argument(
+        "--metrics-file",
+        default=None,
+        help="JSON file rewritten with throughput metrics at every progress update"
+    )
+    parser.add_argument(
+        "--shard-index",
+        type=int,
+        default=0,
+        help="This node's shard of the campaign (0-based)"
+    )
+    parser.add_argument(
+        "--shard-count",
+        type=int,
+        default=1,
+        help="Number of nodes the campaign is split across (combine with 'merge')"
+    )
+    parser.add_argument(
+        "--rollout-offset",
+        type=int,
+        default=0,
+        help="Global ID of the campaign's first rollout"
+    )
+    parser.add_argument(
+        "--endpoint",
+        default="stub",
+        help="With --backend async: model endpoint HOST:PORT, or 'stub' for the in-process stub"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=ASYNC_CONCURRENCY,
+        help="With --backend async: conversations in flight"
+    )
+    parser.add_argument(
+        "--turn-timeout",
+        type=float,
+        default=TURN_TIMEOUT,
+        help="With --backend async: seconds to wait for one model turn"
+    )
+    parser.add_argument(
+        "--stub-latency",
+        type=float,
+        default=0.05,
+        help="With --endpoint stub: seconds per model turn"
+    )
 
     args = parser.parse_args()
-    random.seed(args.seed)
+
+    if args.backend == "numpy" and np is None:
+        print("Error: --backend numpy requires numpy (pip install numpy)")
+        return
+    if args.backend != "python" and args.scheduler != "uniform":
+        print("Error: --scheduler requires --backend python")
+        return
+    if args.backend == "async" and args.workers > 1:
+        print("Error: --backend async runs in one process; use --concurrency instead of --workers")
+        return
+    if args.shard_count < 1 or args.shard_count > max(1, args.rollouts):
+        print(f"Error: --shard-count must be between 1 and --rollouts ({args.rollouts})")
+        return
+    if not 0 <= args.shard_index < args.shard_count:
+        print(f"Error: --shard-index must be in [0, {args.shard_count})")
+        return
+    if args.shard_count > 1 and (args.scheduler != "uniform" or args.target_ci_width is not None):
+        # Both decide what to run next from results so far, which a single shard can't see
+        print("Error: --scheduler and --target-ci-width can't be combined with --shard-count")
+        return
+
+    shard_start, shard_stop = shard_ranges(args.rollouts, args.shard_count)[args.shard_index]
+    shard = None
+    if args.shard_count > 1:
+        shard = {
+            "index": args.shard_index,
+            "shard_count": args.shard_count,
+            "rollout_offset": args.rollout_offset,
+            "campaign_rollouts": args.rollouts,
+            "first_rollout": args.rollout_offset + shard_start,
+            "mode": args.mode,
+            "seed": args.seed,
+            "backend": args.backend
+        }
 
     print("=" * 60)
     print("STEP 1: STRESS TESTING")
     print("=" * 60)
     print(f"Mode: {args.mode}")
     print(f"Rollouts: {args.rollouts}")
+    print(f"Workers: {args.workers}")
+    print(f"Backend: {args.backend}")
+    if shard is not None:
+        print(f"Shard: {args.shard_index + 1}/{args.shard_count} "
+              f"(rollouts {shard['first_rollout']}-{shard['first_rollout'] + shard_stop - shard_start - 1})")
     print()
 
+    checkpoint = None
+    if args.checkpoint or args.resume or args.checkpoint_every is not None:
+        checkpoint = Checkpoint(
+            args.checkpoint or f"{args.output}.ckpt", args.checkpoint_every or CHECKPOINT_EVERY
+        )
+        if args.resume and checkpoint.load() is None:
+            print(f"No checkpoint at {checkpoint.path}; starting from rollout 0")
+
+    scheduler = None
+    if args.scheduler == "thompson":
+        scheduler = ThompsonScheduler(args.seed, min_share=args.min_explore)
+
+    precision = None
+    if args.target_ci_width is not None:
+        precision = PrecisionTarget(
+            width=args.target_ci_width,
+            confidence=args.ci_confidence,
+            per_attack_type=args.ci_per_attack_type
+        )
+
+    driver = None
+    if args.backend == "async":
+        # Imported here: model_client builds its stub on this module
+        from model_client import JsonLineModelClient, StubModelClient, parse_endpoint
+
+        if args.endpoint == "stub":
+            client = StubModelClient(args.mode, args.seed, args.stub_latency)
+        else:
+            try:
+                client = JsonLineModelClient(*parse_endpoint(args.endpoint))
+            except ValueError as e:
+                print(f"Error: {e}")
+                return
+        driver = AsyncRolloutDriver(client, args.concurrency, args.turn_timeout)
+
+    progress = ProgressMonitor(shard_stop - shard_start, args.progress_interval, args.metrics_file)
+
     start_time = time.time()
-    report = run_redteam(mode=args.mode, rollouts=args.rollouts)
+    sink = JsonlFailureSink(args.output) if args.stream else None
+    try:
+        report = run_redteam(
+            mode=args.mode,
+            rollouts=shard_stop - shard_start,
+            seed=args.seed,
+            workers=args.workers,
+            sink=sink,
+            checkpoint=checkpoint,
+            resume=args.resume,
+            backend=args.backend,
+            failure_records=args.failure_records,
+            scheduler=scheduler,
+            precision=precision,
+            progress=progress,
+            first_rollout=args.rollout_offset + shard_start,
+            shard=shard,
+            driver=driver
+        )
+    except ValueError as e:
+        print(f"Error: {e}")
+        print("Re-run with the original --mode, --rollouts and --seed, or without --resume.")
+        return
     elapsed = time.time() - start_time
 
     print()
@@ -167,18 +1635,57 @@ def main():
     print(f"Avg failure turn: {report.avg_failure_turn:.1f}")
 
     print("\nFailures by turn:")
+    # Keep bars readable for large campaigns
+    bar_scale = min(1, 50 / max(report.by_turn.values(), default=1))
     for turn in sorted(report.by_turn.keys()):
         count = report.by_turn[turn]
-        bar = "#" * count
+        bar = "#" * round(count * bar_scale)
         print(f"  Turn {turn}: {count:3d} {bar}")
 
     print("\nFailures by attack type:")
     for attack_type, count in sorted(report.by_attack_type.items(), key=lambda x: -x[1]):
         print(f"  {attack_type}: {count}")
 
-    report.save(args.output)
+    if report.allocation is not None:
+        allocation = report.allocation
+        print(f"\nBudget allocation ({allocation['scheduler']}):")
+        for attack_type, rollouts in allocation["rollouts_by_attack_type"].items():
+            share = allocation["share_by_attack_type"][attack_type]
+            rate = allocation["failure_rate_by_attack_type"][attack_type]
+            print(f"  {attack_type}: {rollouts} rollouts ({share:.1%}), failure rate {rate:.1%}")
+        print(f"  Reweighted failure rate (uniform mix): {allocation['reweighted_failure_rate']:.1%}")
+
+    if report.precision is not None:
+        precision = report.precision
+        lo, hi = precision["interval"]
+        status = "met" if precision["met"] else "NOT met (budget exhausted)"
+        print(f"\nPrecision target {precision['target_width']:.4f}: {status}")
+        print(f"  {precision['confidence']:.0%} interval: [{lo:.4f}, {hi:.4f}] (width {hi - lo:.4f})")
+        print(f"  Rollouts used: {precision['rollouts_used']}/{precision['max_rollouts']}")
+        if precision["per_attack_type"]:
+            for attack_type, (t_lo, t_hi) in precision["by_attack_type"].items():
+                print(f"  {attack_type}: [{t_lo:.4f}, {t_hi:.4f}]")
+
+    if report.driver is not None:
+        driver_stats = report.driver
+        print(f"\nModel turns ({driver_stats['client']}, {driver_stats['concurrency']} in flight): "
+              f"{driver_stats['turns']}")
+        if driver_stats["timeouts"] or driver_stats["errors"] or driver_stats["malformed"]:
+            print(f"  Abandoned conversations: {driver_stats['timeouts']} timed out, "
+                  f"{driver_stats['errors']} connection errors, "
+                  f"{driver_stats['malformed']} malformed replies")
+
+    if not args.stream:
+        report.save(args.output)
     print(f"\nSaved to {args.output}")
+    if report.aggregates_only:
+        print("Aggregates only: step 2 cannot generate tests from this report "
+              "(re-run with --failure-records)")
     print(f"Elapsed time: {elapsed:.1f}s")
+    if report.failures and elapsed > 0:
+        unique = len({(f.attack_type, f.failure_turn) for f in report.failures})
+        print(f"Yield: {report.total_failures / elapsed:.1f} failures/s, "
+              f"{unique} unique patterns ({unique / elapsed:.2f}/s)")
 
 
 if __name__ == "__main__":
@@ -5,18 +5,52 @@ Step 2: Generate Regression Tests from Discovered Failures
 This script converts stress test failures into structured regression tests
 that can be run in CI/CD pipelines.
 
+Failures are read incrementally from either step 1 output format, so
+memory is bounded by the deduplicated tests rather than the input size.
+
 Usage:
     python scripts/step2_generate_regression.py --input artifacts/stress_failures.json
+    python scripts/step2_generate_regression.py --input artifacts/stress_failures.jsonl
+
+    # Collapse near-identical attack trajectories instead of (type, turn) patterns
+    python scripts/step2_generate_regression.py --input artifacts/stress_failures.json \
+        --dedup near --similarity-threshold 0.8
+
+    # Add tests for new failures to the existing suite, keeping existing tests
+    # (a .jsonl suite is appended to; a .json suite is rewritten)
+    python scripts/step2_generate_regression.py --input artifacts/stress_failures.json --incremental
+    python scripts/step2_generate_regression.py --input artifacts/stress_failures.json --incremental \
+        --output artifacts/regression_tests.jsonl
+
+    # Write to a content-addressed test store instead of one JSON file
+    python scripts/step2_generate_regression.py --input artifacts/stress_failures.json \
+        --store artifacts/test_store --incremental
 """
 
 import argparse
 import json
 import hashlib
+import os
+import sys
+from array import array
+from contextlib import nullcontext
 from pathlib import Path
-from dataclasses import dataclass, asdict
-from typing import List, Dict
+from dataclasses import dataclass, asdict, field
+from typing import List, Dict, Iterable, Iterator, Optional, Set, Tuple, Union
 from datetime import datetime
 
+sys.path.insert(0, str(Path(__file__).parent))
+
+from minhash import NUM_PERM, LSHIndex
+from test_store import TestStore
+
+
+# Characters read from a JSON report per chunk
+READ_CHUNK = 1 << 20
+
+# Failure digests buffered before a fresh SuiteState writes them out
+STATE_FLUSH = 1 << 16
+
 
 @dataclass
 class RegressionTest:
@@ -33,6 +67,91 @@ class RegressionTest:
     tags: List[str]
 
 
+class SuiteState:
+    """Sidecar files that let incremental runs skip work done before.
+
+    - ``<base>.failures``: a 64-bit content digest of every failure an
+      earlier run processed, whether it became a test or a duplicate;
+    - ``<base>.minhash``: MinHash signatures of the suite's tests in suite
+      order (``--dedup near``), so existing tests are not re-hashed.
+
+    Both are flat arrays that runs only append to. With ``fresh`` (the
+    first incremental run of a suite) there is nothing to read, and
+    digests are streamed to a temporary file instead of being held in
+    memory; ``save`` moves it into place.
+    """
+
+    def __init__(self, base: str, fresh: bool = False):
+        self.failures_path = Path(f"{base}.failures")
+        self.minhash_path = Path(f"{base}.minhash")
+        self.fresh = fresh
+        self.new_failures = array("Q")
+        self.new_signatures = array("Q")
+        self._pending = None
+
+    def _read(self, path: Path) -> array:
+        values = array("Q")
+        if not self.fresh and path.exists():
+            with open(path, "rb") as f:
+                values.frombytes(f.read())
+        return values
+
+    def failures(self) -> Set[int]:
+        """Digests of failures processed by earlier runs."""
+        return set(self._read(self.failures_path))
+
+    def add_failure(self, digest: int):
+        self.new_failures.append(digest)
+        if self.fresh and len(self.new_failures) >= STATE_FLUSH:
+            self._flush_pending()
+
+    def _flush_pending(self):
+        if self._pending is None:
+            self.failures_path.parent.mkdir(parents=True, exist_ok=True)
+            self._pending = open(self.failures_path.with_name(self.failures_path.name + ".tmp"), "wb")
+        self.new_failures.tofile(self._pending)
+        self.new_failures = array("Q")
+
+    def signatures(self, num_perm: int) -> List[Tuple[int, ...]]:
+        """Saved signatures of the suite's first tests, in suite order."""
+        values = self._read(self.minhash_path)
+        return [tuple(values[i:i + num_perm]) for i in range(0, len(values) - num_perm + 1, num_perm)]
+
+    def add_signature(self, signature: Iterable[int]):
+        """Queue the signature of the next test in suite order."""
+        self.new_signatures.extend(signature)
+
+    def save(self):
+        """Append what this run added (or replace both files, if ``fresh``)."""
+        self.failures_path.parent.mkdir(parents=True, exist_ok=True)
+        if self.fresh:
+            self._flush_pending()
+            self._pending.close()
+            os.replace(self._pending.name, self.failures_path)
+            self._pending = None
+            if self.new_signatures:
+                with open(self.minhash_path, "wb") as f:
+                    self.new_signatures.tofile(f)
+            else:
+                self.minhash_path.unlink(missing_ok=True)
+        else:
+            for path, values in (
+                (self.failures_path, self.new_failures),
+                (self.minhash_path, self.new_signatures)
+            ):
+                if values:
+                    with open(path, "ab") as f:
+                        values.tofile(f)
+        self.new_failures = array("Q")
+        self.new_signatures = array("Q")
+        self.fresh = False
+
+    def remove(self):
+        """Delete the sidecars, which no longer describe a regenerated suite."""
+        self.failures_path.unlink(missing_ok=True)
+        self.minhash_path.unlink(missing_ok=True)
+
+
 @dataclass
 class RegressionSuite:
     """A suite of regression tests."""
@@ -43,9 +162,29 @@ class RegressionSuite:
     tests: List[RegressionTest]
     by_category: Dict[str, int]
     by_severity: Dict[str, int]
+    updated_at: Optional[str] = None
+    # JSONL suites: byte offset just past the last summary line read
+    _jsonl_end: Optional[int] = field(default=None, repr=False, compare=False)
+
+    def summary(self) -> Dict:
+        """Suite fields other than the tests."""
+        return {
+            "generated_at": self.generated_at,
+            "source_file": self.source_file,
+            "total_failures": self.total_failures,
+            "total_tests": self.total_tests,
+            "by_category": self.by_category,
+            "by_severity": self.by_severity,
+            "updated_at": self.updated_at
+        }
 
     def save(self, path: str):
-        """Save suite to JSON."""
+        """Save suite to JSON, or JSONL for a ``.jsonl`` path."""
+        if path.endswith(".jsonl"):
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "wb") as f:
+                self._write_jsonl(f, self.tests)
+            return
         output = {
             "generated_at": self.generated_at,
             "source_file": self.source_file,
@@ -53,12 +192,97 @@ class RegressionSuite:
             "total_tests": self.total_tests,
             "tests": [asdict(t) for t in self.tests],
             "by_category": self.by_category,
-            "by_severity": self.by_severity
+            "by_severity": self.by_severity,
+            "updated_at": self.updated_at
         }
         Path(path).parent.mkdir(parents=True, exist_ok=True)
         with open(path, 'w') as f:
             json.dump(output, f, indent=2)
 
+    def _write_jsonl(self, f, tests: List[RegressionTest]):
+        for test in tests:
+            f.write(json.dumps(asdict(test)).encode() + b"\n")
+        f.write(json.dumps({"summary": self.summary()}).encode() + b"\n")
+        f.flush()
+        self._jsonl_end = f.tell()
+
+    def append(self, path: str, new_tests: List[RegressionTest]):
+        """Write an incremental update to a JSONL suite loaded from ``path``:
+        ``new_tests`` and the updated summary are appended, so the cost is
+        independent of the suite's size. Anything an interrupted update
+        left after the last summary line is dropped first."""
+        with open(path, "r+b") as f:
+            f.truncate(self._jsonl_end)
+            f.seek(self._jsonl_end)
+            self._write_jsonl(f, new_tests)
+
+    @classmethod
+    def load(cls, path: str) -> "RegressionSuite":
+        """Load a suite saved by ``save``.
+
+        A JSONL suite is one test per line, each update ending with a
+        ``{"summary": {...}}`` line; the last summary holds the counts and
+        tests after it (from an interrupted update) are ignored.
+        """
+        if path.endswith(".jsonl"):
+            tests, pending, data, end = [], [], None, 0
+            with open(path, "rb") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        break  # partly written line of an interrupted update
+                    if "summary" in record:
+                        tests += pending
+                        pending = []
+                        data, end = record["summary"], f.tell()
+                    else:
+                        pending.append(RegressionTest(**record))
+            if data is None:
+                raise ValueError(f"{path} has no summary line")
+            suite = cls(tests=tests, **data)
+            suite._jsonl_end = end
+            return suite
+        with open(path) as f:
+            data = json.load(f)
+        data["tests"] = [RegressionTest(**t) for t in data["tests"]]
+        return cls(**data)
+
+    def save_to_store(self, store: TestStore, name: str):
+        """Save suite ``name`` to a content-addressed store.
+
+        Each test is stored as its own record; tests already in the store
+        are not rewritten. The manifest lists every test's digest with its
+        category and severity. Callers updating an existing suite should
+        hold ``store.lock(name)`` from load to save.
+        """
+        entries = [
+            {
+                "test_id": test.test_id,
+                "digest": store.put(asdict(test)),
+                "category": test.category,
+                "severity": test.severity
+            }
+            for test in self.tests
+        ]
+        store.write_manifest(name, {
+            "generated_at": self.generated_at,
+            "source_file": self.source_file,
+            "total_failures": self.total_failures,
+            "total_tests": self.total_tests,
+            "tests": entries,
+            "by_category": self.by_category,
+            "by_severity": self.by_severity,
+            "updated_at": self.updated_at
+        })
+
+    @classmethod
+    def load_from_store(cls, store: TestStore, name: str) -> "RegressionSuite":
+        """Load suite ``name`` saved by ``save_to_store``."""
+        data = store.read_manifest(name)
+        data["tests"] = [RegressionTest(**store.get(e["digest"])) for e in data["tests"]]
+        return cls(**data)
+
 
 def severity_from_harm(harm_level: int) -> str:
     """Map harm level to severity."""
@@ -82,32 +306,250 @@ def generate_test_name(attack_type: str, failure_turn: int) -> str:
     return names.get(attack_type, f"Unknown failure at turn {failure_turn}")
 
 
-def generate_tests(input_path: str) -> RegressionSuite:
-    """Generate regression tests from failures."""
-    with open(input_path) as f:
-        data = json.load(f)
-
-    failures = data.get("failures", [])
-    tests = []
-    by_category = {}
-    by_severity = {}
+class _JsonReader:
+    """Chunked reader that decodes one JSON value at a time from a file."""
+
+    def __init__(self, f, chunk_size: int = READ_CHUNK):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        """Read another chunk; False at end of file."""
+        if self.eof:
+            return False
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character ('' at end of file)."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos].isspace():
+                self.pos += 1
+            if self.pos < len(self.buf) or not self._fill():
+                return self.buf[self.pos:self.pos + 1]
+
+    def expect(self, chars: str) -> str:
+        """Consume the next character, which must be one of ``chars``."""
+        char = self.peek()
+        if not char or char not in chars:
+            raise ValueError(f"Expected one of {chars!r} in JSON input, got {char!r}")
+        self.pos += 1
+        return char
+
+    def value(self):
+        """Decode the next complete JSON value."""
+        self.peek()
+        decoder = json.JSONDecoder()
+        while True:
+            try:
+                value, end = decoder.raw_decode(self.buf, self.pos)
+                # A number that reaches the buffer edge may continue in the next chunk
+                if self.eof or (end < len(self.buf) and self.buf[end] not in "0123456789.eE+-"):
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self._fill()
+
+
+def _aggregates_only(path: str) -> ValueError:
+    return ValueError(
+        f"{path} holds failure counts only (step 1 --backend numpy without "
+        f"--failure-records); re-run step 1 with --failure-records"
+    )
 
-    # Deduplicate similar failures
-    seen_patterns = set()
 
-    for failure in failures:
+def iter_failures_json(path: str) -> Iterator[Dict]:
+    """Yield failures from a ``{"failures": [...]}`` report without loading it whole."""
+    with open(path) as f:
+        reader = _JsonReader(f)
+        reader.expect("{")
+        if reader.peek() == "}":
+            return
+        while True:
+            key = reader.value()
+            reader.expect(":")
+            if key == "failures":
+                reader.expect("[")
+                if reader.peek() != "]":
+                    while True:
+                        yield reader.value()
+                        if reader.expect(",]") == "]":
+                            break
+                else:
+                    reader.expect("]")
+            elif key == "aggregates_only":
+                if reader.value():
+                    raise _aggregates_only(path)
+            else:
+                reader.value()
+            if reader.expect(",}") == "}":
+                return
+
+
+def iter_failures_jsonl(path: str) -> Iterator[Dict]:
+    """Yield failures from a streamed (``--stream``) step 1 report."""
+    with open(path) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if "summary" not in record:
+                yield record
+            elif record["summary"].get("aggregates_only"):
+                raise _aggregates_only(path)
+
+
+def read_failures(path: str) -> Iterator[Dict]:
+    """Yield failures from a step 1 report in either output format.
+
+    Raises ``ValueError`` for a report without failure records.
+    """
+    if path.endswith(".jsonl"):
+        return iter_failures_jsonl(path)
+    return iter_failures_json(path)
+
+
+class PatternDedup:
+    """One test per (attack type, failure turn) pattern."""
+
+    name = "pattern"
+
+    def __init__(self):
+        self.seen_patterns = set()
+
+    def seed(self, tests: Iterable[RegressionTest], state: Optional[SuiteState] = None):
+        """Treat existing suite tests as already seen."""
+        for test in tests:
+            self.seen_patterns.add(test.test_id[len("reg_"):])
+
+    def test_key(self, failure: Dict) -> Optional[str]:
+        """Key for a new test from ``failure``, or None if it is a duplicate."""
         # Create pattern hash for deduplication
         pattern = f"{failure['attack_type']}_{failure['failure_turn']}"
         pattern_hash = hashlib.md5(pattern.encode()).hexdigest()[:8]
 
-        if pattern_hash in seen_patterns:
-            continue
-        seen_patterns.add(pattern_hash)
+        if pattern_hash in self.seen_patterns:
+            return None
+        self.seen_patterns.add(pattern_hash)
+        return pattern_hash
+
+
+class NearDuplicateDedup:
+    """One test per cluster of near-identical attack trajectories.
+
+    Trajectories are compared by word-shingle Jaccard similarity through a
+    MinHash/LSH index per attack type, so each lookup checks a few
+    candidates instead of every earlier test. Exact repeats are caught by
+    a content hash before any MinHash work.
+    """
+
+    name = "near"
+
+    def __init__(self, threshold: float = 0.8):
+        if not 0 < threshold <= 1:
+            raise ValueError(f"Similarity threshold must be in (0, 1], got {threshold}")
+        self.threshold = threshold
+        self.indexes: Dict[str, LSHIndex] = {}
+        self.seen_contents = set()
+        self.state: Optional[SuiteState] = None
+
+    def _index(self, attack_type: str) -> LSHIndex:
+        index = self.indexes.get(attack_type)
+        if index is None:
+            index = self.indexes[attack_type] = LSHIndex(self.threshold)
+        return index
+
+    def seed(self, tests: Iterable[RegressionTest], state: Optional[SuiteState] = None):
+        """Index existing suite tests so new failures are checked against them.
+
+        Signatures saved in ``state`` are reused; only tests without one
+        (added by another dedup mode) are hashed. Signatures computed from
+        here on are queued in ``state`` in suite order.
+        """
+        self.state = state
+        saved = state.signatures(NUM_PERM) if state is not None else []
+        for i, test in enumerate(tests):
+            index = self._index(test.category)
+            if i < len(saved):
+                # An exact repeat of a saved test matches it with similarity 1
+                signature = saved[i]
+            else:
+                text = "\n".join(test.attack_turns)
+                self.seen_contents.add(hashlib.md5(f"{test.category}\n{text}".encode()).digest())
+                signature = index.signature(text)
+                if state is not None:
+                    state.add_signature(signature)
+            index.add(test.test_id[len("reg_"):], signature)
+
+    def test_key(self, failure: Dict) -> Optional[str]:
+        """Key for a new test from ``failure``, or None if it is a near-duplicate."""
+        attack_type = failure["attack_type"]
+        text = "\n".join(failure.get("trajectory", []))
+        digest = hashlib.md5(f"{attack_type}\n{text}".encode()).digest()
+        if digest in self.seen_contents:
+            return None
+        self.seen_contents.add(digest)
+
+        index = self._index(attack_type)
+        signature = index.signature(text)
+        if index.query(signature) is not None:
+            return None
+
+        key = digest.hex()[:12]
+        index.add(key, signature)
+        if self.state is not None:
+            self.state.add_signature(signature)
+        return key
+
+
+class TestGenerator:
+    """Turns failures into deduplicated regression tests one at a time.
+
+    Only the dedup state and the running counts are kept, so failures can
+    come from a stream of any length.
+    """
+
+    def __init__(
+        self,
+        dedup=None,
+        by_category: Optional[Dict[str, int]] = None,
+        by_severity: Optional[Dict[str, int]] = None
+    ):
+        self.total_failures = 0
+        # Counts are updated in place, so a suite's own dicts can be passed in
+        self.by_category = by_category if by_category is not None else {}
+        self.by_severity = by_severity if by_severity is not None else {}
+        # Deduplicate similar failures
+        self.dedup = dedup if dedup is not None else PatternDedup()
+
+    def iter_tests(self, failures: Iterable[Dict]) -> Iterator[RegressionTest]:
+        """Yield a test for each failure that is not a duplicate, as it is read."""
+        for failure in failures:
+            self.total_failures += 1
+            test = self.add(failure)
+            if test is not None:
+                yield test
+
+    def add(self, failure: Dict):
+        """Return the test for ``failure``, or None if it duplicates an earlier one."""
+        key = self.dedup.test_key(failure)
+        if key is None:
+            return None
 
         severity = severity_from_harm(failure["harm_level"])
 
         test = RegressionTest(
-            test_id=f"reg_{pattern_hash}",
+            test_id=f"reg_{key}",
             source_failure_id=failure["failure_id"],
             name=generate_test_name(failure["attack_type"], failure["failure_turn"]),
             category=failure["attack_type"],
@@ -118,20 +560,95 @@ def generate_tests(input_path: str) -> RegressionSuite:
             created_at=datetime.now().isoformat(),
             tags=[failure["attack_type"], severity, f"turn_{failure['failure_turn']}"]
         )
-        tests.append(test)
 
-        by_category[failure["attack_type"]] = by_category.get(failure["attack_type"], 0) + 1
-        by_severity[severity] = by_severity.get(severity, 0) + 1
-
-    return RegressionSuite(
+        self.by_category[failure["attack_type"]] = self.by_category.get(failure["attack_type"], 0) + 1
+        self.by_severity[severity] = self.by_severity.get(severity, 0) + 1
+        return test
+
+
+def generate_tests(
+    source: Union[str, Iterable[Dict]],
+    dedup=None,
+    state: Optional[SuiteState] = None
+) -> RegressionSuite:
+    """Generate regression tests from failures.
+
+    ``source`` is a step 1 report path (JSON or JSONL) or any iterable of
+    failure dicts; either way failures are consumed one at a time.
+    ``dedup`` defaults to ``PatternDedup``. Pass a fresh ``state`` to
+    record the processed failures for later incremental runs; without
+    one, memory is bounded by the dedup state alone.
+    """
+    suite = RegressionSuite(
         generated_at=datetime.now().isoformat(),
-        source_file=input_path,
-        total_failures=len(failures),
-        total_tests=len(tests),
-        tests=tests,
-        by_category=by_category,
-        by_severity=by_severity
+        source_file=source if isinstance(source, str) else "<stream>",
+        total_failures=0,
+        total_tests=0,
+        tests=[],
+        by_category={},
+        by_severity={}
     )
+    update_tests(suite, source, dedup, state)
+    suite.updated_at = None
+    return suite
+
+
+def failure_digest(failure: Dict) -> int:
+    """64-bit content hash of a failure record.
+
+    The failure ID is left out: step 1 numbers failures by position, so
+    the same failure gets a different ID in a merged or re-run report.
+    """
+    content = {key: value for key, value in failure.items() if key != "failure_id"}
+    canonical = json.dumps(content, sort_keys=True).encode()
+    return int.from_bytes(hashlib.blake2b(canonical, digest_size=8).digest(), "big")
+
+
+def update_tests(
+    suite: RegressionSuite,
+    source: Union[str, Iterable[Dict]],
+    dedup=None,
+    state: Optional[SuiteState] = None
+) -> List[RegressionTest]:
+    """Add tests for failures the suite has not seen yet; return the new tests.
+
+    Existing tests, their IDs and timestamps are left as they are; the
+    dedup state is seeded from them so new failures that duplicate an
+    existing test are skipped. With a ``state``, failures whose content
+    digest an earlier run recorded are skipped before dedup or test
+    generation, wherever they appear in ``source``, and the new digests
+    are queued for ``state.save()``. The suite's counts are updated in
+    place.
+    """
+    dedup = dedup if dedup is not None else PatternDedup()
+    dedup.seed(suite.tests, state)
+    failures = read_failures(source) if isinstance(source, str) else source
+
+    if state is not None:
+        # A fresh state has nothing to skip; repeats within the input are
+        # left to dedup rather than kept in a set
+        seen = None if state.fresh else state.failures()
+
+        def unseen(failures):
+            for failure in failures:
+                digest = failure_digest(failure)
+                if seen is not None:
+                    if digest in seen:
+                        continue
+                    seen.add(digest)
+                state.add_failure(digest)
+                yield failure
+
+        failures = unseen(failures)
+
+    generator = TestGenerator(dedup, suite.by_category, suite.by_severity)
+    new_tests = list(generator.iter_tests(failures))
+
+    suite.tests.extend(new_tests)
+    suite.total_tests = len(suite.tests)
+    suite.total_failures += generator.total_failures
+    suite.updated_at = datetime.now().isoformat()
+    return new_tests
 
 
 def main():
@@ -141,12 +658,41 @@ def main():
     parser.add_argument(
         "--input",
         required=True,
-        help="Input file with stress test failures"
+        help="Input file with stress test failures (.json, or .jsonl from --stream)"
     )
     parser.add_argument(
         "--output",
         default="artifacts/regression_tests.json",
-        help="Output file path"
+        help="Output file path (.json, or .jsonl to append on --incremental updates)"
+    )
+    parser.add_argument(
+        "--dedup",
+        choices=["pattern", "near"],
+        default="pattern",
+        help="Duplicate detection: one test per (attack type, turn), or per cluster "
+             "of near-identical trajectories"
+    )
+    parser.add_argument(
+        "--similarity-threshold",
+        type=float,
+        default=0.8,
+        help="With --dedup near: trajectory Jaccard similarity that counts as a duplicate"
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Add tests for new failures to the suite at --output instead of regenerating it "
+             "(also records processed failures for later --incremental runs)"
+    )
+    parser.add_argument(
+        "--store",
+        default=None,
+        help="Save to this content-addressed test store directory instead of --output"
+    )
+    parser.add_argument(
+        "--suite",
+        default="regression",
+        help="With --store: suite name"
     )
 
     args = parser.parse_args()
@@ -160,9 +706,63 @@ def main():
     print("STEP 2: REGRESSION TEST GENERATION")
     print("=" * 60)
     print(f"Input: {args.input}")
+    print(f"Dedup: {args.dedup}")
     print()
 
-    suite = generate_tests(args.input)
+    if args.dedup == "near":
+        try:
+            dedup = NearDuplicateDedup(args.similarity_threshold)
+        except ValueError as e:
+            print(f"Error: {e}")
+            return
+    else:
+        dedup = PatternDedup()
+
+    store = TestStore(args.store) if args.store else None
+    target = f"{args.store} (suite {args.suite})" if store else args.output
+    # Processed-failure digests live next to the suite file or manifest
+    state_base = str(store.manifests / args.suite) if store else args.output
+    # Hold the suite lock from load to save so concurrent updates are not lost
+    with store.lock(args.suite) if store else nullcontext():
+        if store:
+            existing_suite = store.has_manifest(args.suite)
+        else:
+            existing_suite = Path(args.output).exists()
+
+        if args.incremental and existing_suite:
+            if store:
+                suite = RegressionSuite.load_from_store(store, args.suite)
+            else:
+                suite = RegressionSuite.load(args.output)
+            state = SuiteState(state_base)
+            existing, seen = suite.total_tests, suite.total_failures
+            try:
+                new_tests = update_tests(suite, args.input, dedup, state)
+            except ValueError as e:
+                print(f"Error: {e}")
+                return
+            print(f"Incremental update of {target}: {existing} existing tests, "
+                  f"{suite.total_failures - seen} unseen failures, {len(new_tests)} new tests")
+            print()
+        else:
+            # Only incremental runs record what they processed
+            state = SuiteState(state_base, fresh=True) if args.incremental else None
+            try:
+                suite = generate_tests(args.input, dedup, state)
+            except ValueError as e:
+                print(f"Error: {e}")
+                return
+
+        if store:
+            suite.save_to_store(store, args.suite)
+        elif args.incremental and existing_suite and args.output.endswith(".jsonl"):
+            suite.append(args.output, new_tests)
+        else:
+            suite.save(args.output)
+        if state is not None:
+            state.save()
+        else:
+            SuiteState(state_base).remove()
 
     print("=" * 60)
     print("RESULTS")
@@ -186,8 +786,9 @@ def main():
     if len(suite.tests) > 5:
         print(f"  ... and {len(suite.tests) - 5} more")
 
-    suite.save(args.output)
-    print(f"\nSaved to {args.output}")
+    print(f"\nSaved to {target}")
+    if store:
+        print(f"Test records written: {store.written} (unchanged tests are not rewritten)")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Release Gate Test History
+
+Regression counts per regression test and per category from past gate
+runs, kept in a JSON file. A regression is a test that passed on the
+baseline and failed on the candidate; tests that fail on both models
+say nothing about what a new release breaks. The gate uses the counts to
+run the tests most likely to expose a regression first, so a broken
+candidate shows up in the first few batches instead of at the end of the
+suite.
+
+A test's priority is its estimated regression rate, weighted by severity
+and boosted for recently created tests:
+
+    priority = SEVERITY_WEIGHT[severity] * regression_rate * (1 + 0.5 ** (age_days / half_life))
+
+``regression_rate`` is the test's own regression rate shrunk toward its
+category's, so a test with little history is ranked by its category and
+a test never seen before still gets a sensible position.
+
+Usage:
+    history = TestHistory.load("artifacts/gate_history.json")
+    ordered = prioritize(tests, history)
+    ...
+    history.record(tests, matrix.row("v1"), matrix.row("v2"))
+    history.save()
+"""
+
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+SEVERITY_WEIGHT = {"critical": 8, "high": 4, "medium": 2, "low": 1}
+
+# Days for the recency boost of a new test to halve
+RECENCY_HALF_LIFE_DAYS = 30.0
+
+# Weight, in runs, of the category regression rate behind a test's own rate
+PRIOR_RUNS = 4
+
+
+class TestHistory:
+    """Per-test and per-category ``[regressions, runs]`` counts."""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.tests: Dict[str, List[int]] = {}
+        self.categories: Dict[str, List[int]] = {}
+
+    @classmethod
+    def load(cls, path: str) -> "TestHistory":
+        """Read ``path``, or start an empty history if it does not exist."""
+        history = cls(path)
+        if Path(path).exists():
+            with open(path) as f:
+                data = json.load(f)
+            history.tests = data["tests"]
+            history.categories = data["categories"]
+        return history
+
+    def save(self, path: Optional[str] = None):
+        path = path or self.path
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump({"tests": self.tests, "categories": self.categories}, f)
+
+    def record(self, tests: Iterable[Dict], baseline_passed: Iterable, candidate_passed: Iterable):
+        """Add one gate run: whether each of ``tests`` passed on the
+        baseline and on the candidate (e.g. ``ResultsMatrix.row``)."""
+        for test, b, c in zip(tests, baseline_passed, candidate_passed):
+            regressed = b and not c
+            for counts, key in (
+                (self.tests, test["test_id"]),
+                (self.categories, test.get("category", "unknown"))
+            ):
+                counter = counts.setdefault(key, [0, 0])
+                counter[0] += regressed
+                counter[1] += 1
+
+    def regression_rate(self, test: Dict) -> float:
+        """Estimated chance that ``test`` regresses on a new candidate."""
+        cat_regressions, cat_runs = self.categories.get(test.get("category", "unknown"), (0, 0))
+        category_rate = (cat_regressions + 1) / (cat_runs + 2)
+        regressions, runs = self.tests.get(test["test_id"], (0, 0))
+        return (regressions + PRIOR_RUNS * category_rate) / (runs + PRIOR_RUNS)
+
+    def priority(self, test: Dict, now: datetime) -> float:
+        """Higher runs earlier."""
+        recency = 0.0
+        created_at = test.get("created_at")
+        if created_at:
+            age_days = max(0.0, (now - datetime.fromisoformat(created_at)).total_seconds() / 86400)
+            recency = 0.5 ** (age_days / RECENCY_HALF_LIFE_DAYS)
+        weight = SEVERITY_WEIGHT.get(test.get("severity"), 1)
+        return weight * self.regression_rate(test) * (1 + recency)
+
+
+def prioritize(
+    tests: List[Dict],
+    history: TestHistory,
+    now: Optional[datetime] = None
+) -> List[Dict]:
+    """``tests`` ordered by descending priority; ties keep suite order."""
+    now = now or datetime.now()
+    priority = {test["test_id"]: history.priority(test, now) for test in tests}
+    return sorted(tests, key=lambda test: -priority[test["test_id"]])
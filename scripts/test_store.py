@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Content-Addressed Regression Test Store
+
+Stores each regression test as its own record, named by the SHA-256 of its
+content, under two-character shard directories:
+
+    <root>/objects/3f/3fa4...e1.json     one test record
+    <root>/manifests/<suite>.json        suite membership and summary
+
+A manifest lists the suite's tests with their category and severity, so a
+reader can pick the tests it needs and open only those records. Records
+are immutable: writing a test that is already stored costs no I/O, and
+concurrent writers of the same test produce the same file. Every write
+goes through a temporary file and an atomic rename, and manifest updates
+hold a per-suite lock so concurrent suite updates do not lose each other.
+
+Usage:
+    store = TestStore("artifacts/test_store")
+    digest = store.put(test_record)
+    with store.lock("regression"):
+        store.write_manifest("regression", manifest)
+    records = store.load_tests("regression", categories=["intent_drift"])
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+# Seconds between attempts to take a suite lock, and before giving up
+LOCK_POLL = 0.05
+LOCK_TIMEOUT = 30.0
+
+
+def content_digest(record: Dict) -> str:
+    """SHA-256 of a record's canonical JSON encoding."""
+    canonical = json.dumps(record, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class TestStore:
+    """Directory of content-addressed test records plus suite manifests."""
+
+    def __init__(self, root: str):
+        self.root = Path(root)
+        self.objects = self.root / "objects"
+        self.manifests = self.root / "manifests"
+        # Records actually written (not already present) by this instance
+        self.written = 0
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects / digest[:2] / f"{digest}.json"
+
+    def _manifest_path(self, name: str) -> Path:
+        return self.manifests / f"{name}.json"
+
+    def _write_atomic(self, path: Path, data: str):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(data)
+            os.chmod(tmp, 0o644)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def put(self, record: Dict) -> str:
+        """Store ``record`` and return its digest; a no-op if already stored."""
+        digest = content_digest(record)
+        path = self._object_path(digest)
+        if not path.exists():
+            self._write_atomic(path, json.dumps(record, sort_keys=True))
+            self.written += 1
+        return digest
+
+    def get(self, digest: str) -> Dict:
+        """Read the record stored under ``digest``."""
+        with open(self._object_path(digest)) as f:
+            return json.load(f)
+
+    def has_manifest(self, name: str) -> bool:
+        return self._manifest_path(name).exists()
+
+    def read_manifest(self, name: str) -> Dict:
+        """Read suite ``name``'s manifest."""
+        with open(self._manifest_path(name)) as f:
+            return json.load(f)
+
+    def write_manifest(self, name: str, manifest: Dict):
+        """Atomically replace suite ``name``'s manifest. Hold ``lock(name)``
+        across read-modify-write updates."""
+        self._write_atomic(self._manifest_path(name), json.dumps(manifest, indent=2))
+
+    @contextmanager
+    def lock(self, name: str, timeout: float = LOCK_TIMEOUT):
+        """Exclusive lock on suite ``name`` across processes."""
+        path = self.manifests / f"{name}.lock"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                break
+            except FileExistsError:
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Suite {name!r} is locked ({path}); remove it if stale")
+                time.sleep(LOCK_POLL)
+        try:
+            os.write(fd, str(os.getpid()).encode())
+            os.close(fd)
+            yield
+        finally:
+            path.unlink(missing_ok=True)
+
+    def select(
+        self,
+        name: str,
+        categories: Optional[Iterable[str]] = None,
+        severities: Optional[Iterable[str]] = None
+    ) -> List[Dict]:
+        """Manifest entries of suite ``name``, optionally filtered."""
+        entries = self.read_manifest(name)["tests"]
+        if categories is not None:
+            categories = set(categories)
+            entries = [e for e in entries if e["category"] in categories]
+        if severities is not None:
+            severities = set(severities)
+            entries = [e for e in entries if e["severity"] in severities]
+        return entries
+
+    def load_tests(
+        self,
+        name: str,
+        categories: Optional[Iterable[str]] = None,
+        severities: Optional[Iterable[str]] = None
+    ) -> Iterator[Dict]:
+        """Yield the test records of suite ``name``, reading only those selected."""
+        for entry in self.select(name, categories, severities):
+            yield self.get(entry["digest"])
@@ -0,0 +1,64 @@
+"""Early stopping of the release gate's sequential mode.
+
+Run with ``python -m unittest discover tests`` from the repository root.
+"""
+
+import io
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from rng_streams import RNGStreams
+import step3_run_release_gate as step3
+
+SUITE = 20000
+
+# Pass rate per model version
+PASS_RATES = {"base": 0.90, "good": 0.92, "same": 0.90, "broken": 0.80}
+
+
+def run_fixed_rate(test, model, seed):
+    rng = RNGStreams(seed).test(test["test_id"], model)
+    passed = rng.random() < PASS_RATES[model]
+    return step3.TestResult(test["test_id"], model, passed, None if passed else 3, 0.8)
+
+
+class SequentialGateTest(unittest.TestCase):
+
+    def gate(self, candidate, spending):
+        tests = [{"test_id": f"t{i}", "category": "policy_erosion"} for i in range(SUITE)]
+        gate = step3.SequentialGate(spending=spending)
+        with tempfile.TemporaryDirectory() as tmp, redirect_stdout(io.StringIO()):
+            verdict, output = step3.run_regression(
+                "base", candidate, None, str(Path(tmp) / "report.html"),
+                tests=tests,
+                executor=step3.TestExecutor(runner=run_fixed_rate),
+                sequential=gate
+            )
+            html = Path(output).read_text()
+        executed = int(html.split("Sequential mode: executed ")[1].split()[0])
+        return verdict, executed
+
+    def test_clear_outcomes_stop_early(self):
+        for spending in step3.SPENDING:
+            for candidate, expected in [("good", "OK"), ("same", "OK"), ("broken", "BLOCK")]:
+                with self.subTest(spending=spending, candidate=candidate):
+                    verdict, executed = self.gate(candidate, spending)
+                    self.assertEqual(verdict, expected)
+                    self.assertLessEqual(executed, SUITE // 2)
+
+    def test_boundaries(self):
+        gate = step3.SequentialGate(batch_size=500)
+        bounds = gate.boundaries(SUITE)
+        self.assertEqual(len(bounds), SUITE // 500)
+        # Only the last look, the whole suite, is exact
+        self.assertEqual(bounds[-1], float("inf"))
+        self.assertTrue(all(2 < c < 4 for c in bounds[:-1]))
+
+
+if __name__ == "__main__":
+    unittest.main()